@@ -1,14 +1,24 @@
+import atexit
+import copy
+import logging
+import logging.config
+import logging.handlers
 import os
+import queue
 import sys
+from functools import lru_cache
+from types import MappingProxyType
 
 # 项目根目录
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
-# 确保src目录在Python路径中
-sys.path.append(PROJECT_ROOT)
+# 确保src目录在Python路径中（重复导入时不追加重复条目）
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
+@lru_cache(maxsize=None)
 def get_path(*path_parts):
-    """获取项目内的绝对路径"""
+    """获取项目内的绝对路径（结果按参数缓存）"""
     return os.path.join(PROJECT_ROOT, *path_parts)
 
 # 模板目录
@@ -147,6 +157,45 @@ FLASHCARD_CONFIG = {
 
 }
 
+
+def _freeze(value):
+    """递归冻结配置：dict 转为只读 MappingProxyType，list 转为 tuple，字符串驻留"""
+    if isinstance(value, dict):
+        return MappingProxyType({_freeze(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# 闪卡配置在运行期不变，冻结后可直接共享而无需防御性拷贝
+FLASHCARD_CONFIG = _freeze(FLASHCARD_CONFIG)
+
+# 模板名称 -> 文件路径 / 描述 的扁平查找表，热路径只需一次字典查找
+TEMPLATE_FILE_BY_NAME = MappingProxyType({
+    name: info['file_path']
+    for name, info in FLASHCARD_CONFIG['available_templates'].items()
+})
+TEMPLATE_DESCRIPTIONS = MappingProxyType({
+    name: info['description']
+    for name, info in FLASHCARD_CONFIG['available_templates'].items()
+    if 'description' in info
+})
+
+
+@lru_cache(maxsize=64)
+def resolve_template(name):
+    """
+    解析模板名称对应的模板文件绝对路径，文件不存在时返回 None。
+    存在与不存在的结果都按进程缓存；运行期新增模板文件后需调用 resolve_template.cache_clear()。
+    """
+    file_path = TEMPLATE_FILE_BY_NAME.get(name)
+    if not file_path:
+        return None
+    path = os.path.join(TEMPLATES_DIR, file_path)
+    return path if os.path.isfile(path) else None
+
 # Markdown解析器配置
 MARKDOWN_CONFIG = {
     # 默认扩展
@@ -186,7 +235,22 @@ JSON_VALIDATION_CONFIG = {
     'max_tag_length': 50
 }
 
-# 日志配置
+# 日志队列：请求线程只入队，文件写入由后台 QueueListener 完成
+log_queue = queue.Queue(-1)
+
+
+def _env_log_level(default='INFO'):
+    """读取 FLASHCARD_LOG_LEVEL（如 DEBUG/INFO/WARNING），无效值回退到默认级别"""
+    level = os.environ.get('FLASHCARD_LOG_LEVEL', default).strip().upper()
+    return level if isinstance(logging.getLevelName(level), int) else default
+
+
+# 项目日志级别，默认 INFO
+LOG_LEVEL = _env_log_level()
+
+# 日志配置：只配置项目自身的 'src' 与 'mcp' logger，不修改 root，第三方库的日志保持默认行为。
+# 'file' 处理器由 configure_logging 挂到 QueueListener 上；写入队列的 QueueHandler 也由其手动创建，
+# 不放进 dictConfig —— 部分 Python 3.12 版本要求 dictConfig 中的 QueueHandler 声明 'handlers'，否则拒绝配置
 LOGGING_CONFIG = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -205,31 +269,72 @@ LOGGING_CONFIG = {
             'level': 'INFO'
         },
         'file': {
-            'class': 'logging.FileHandler',
+            # 按大小轮转，避免日志文件无限增长
+            'class': 'logging.handlers.RotatingFileHandler',
             'filename': get_path('logs', 'app.log'),
             'formatter': 'default',
-            'level': 'DEBUG',
-            'encoding': 'utf-8'
+            'level': LOG_LEVEL,
+            'encoding': 'utf-8',
+            'maxBytes': 5 * 1024 * 1024,
+            'backupCount': 3,
+            # 首次写入时才打开日志文件
+            'delay': True
         }
     },
-    'root': {
-        'handlers': ['console', 'file'],
-        'level': 'DEBUG'
-    },
     'loggers': {
         'mcp': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
             'propagate': False
         },
         'src': {
-            'handlers': ['console', 'file'],
-            'level': 'DEBUG',
+            'handlers': ['console'],
+            'level': LOG_LEVEL,
             'propagate': False
         }
     }
 }
 
+# 后台日志监听器（configure_logging 首次调用时创建）
+_log_listener = None
+
+
+def configure_logging():
+    """应用 LOGGING_CONFIG，并启动负责把 'src'/'mcp' 日志写入轮转文件的后台 QueueListener"""
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+
+    logging_config = copy.deepcopy(LOGGING_CONFIG)
+    file_spec = logging_config['handlers'].pop('file')
+    file_handler = logging.handlers.RotatingFileHandler(
+        file_spec['filename'],
+        maxBytes=file_spec.get('maxBytes', 0),
+        backupCount=file_spec.get('backupCount', 0),
+        encoding=file_spec.get('encoding'),
+        delay=file_spec.get('delay', False)
+    )
+    file_handler.setLevel(file_spec['level'])
+    file_handler.setFormatter(logging.Formatter(logging_config['formatters'][file_spec['formatter']]['format']))
+
+    logging.config.dictConfig(logging_config)
+
+    # 请求线程只把日志记录放入队列，由后台监听器写文件；只挂到项目 logger 上
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for logger_name in logging_config['loggers']:
+        logging.getLogger(logger_name).addHandler(queue_handler)
+
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_stop_log_listener)
+    return _log_listener
+
+
+def _stop_log_listener():
+    """退出时停止日志监听器；已停止时跳过（3.10/3.11 上重复调用 stop() 会抛出 AttributeError）"""
+    if _log_listener is not None and getattr(_log_listener, '_thread', None) is not None:
+        _log_listener.stop()
+
 # API路径配置
 API_PATHS = {
     'generate_flashcard': '/api/generate-flashcard',
@@ -238,62 +343,59 @@ API_PATHS = {
     'health_check': '/api/health'
 }
 
+# 日志目录
+_LOG_DIR = get_path('logs')
+
+# 目录是否已创建（重复导入时跳过文件系统调用）
+_DIRS_READY = False
+
 # 创建必要的目录
 def ensure_directories():
     """确保必要的目录存在"""
-    # 确保日志目录存在
-    log_dir = get_path('logs')
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 确保静态目录存在
-    if not os.path.exists(STATIC_DIR):
-        os.makedirs(STATIC_DIR)
-
-    # 确保输出目录存在
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
-    
-    # 确保模板目录存在
-    if not os.path.exists(TEMPLATES_DIR):
-        os.makedirs(TEMPLATES_DIR)
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    # exist_ok=True 将“检查 + 创建”合并为一次系统调用
+    for directory in (_LOG_DIR, STATIC_DIR, OUTPUT_DIR, TEMPLATES_DIR):
+        os.makedirs(directory, exist_ok=True)
+    _DIRS_READY = True
 
 # 在导入时确保目录存在
 ensure_directories()
 
 
+# 各环境的配置映射（只读，避免每次调用重建）
+_ENV_CONFIG_MAP = MappingProxyType({
+    'development': MappingProxyType({
+        'debug': True,
+        'log_level': 'DEBUG'
+    }),
+    'production': MappingProxyType({
+        'debug': False,
+        'log_level': 'INFO',
+        'workers': 4
+    }),
+    'testing': MappingProxyType({
+        'debug': False,
+        'log_level': 'INFO'
+    })
+})
+
 # 根据环境变量加载不同配置
 def load_env_config(env='development'):
     """根据环境加载不同的配置"""
-    config_map = {
-        'development': {
-            'debug': True,
-            'log_level': 'DEBUG'
-        },
-        'production': {
-            'debug': False,
-            'log_level': 'INFO',
-            'workers': 4
-        },
-        'testing': {
-            'debug': False,
-            'log_level': 'INFO'
-        }
-    }
-    
     # 获取当前环境的配置
-    env_config = config_map.get(env, config_map['development'])
+    env_config = _ENV_CONFIG_MAP.get(env, _ENV_CONFIG_MAP['development'])
     
     # 更新SERVER_CONFIG
-    for key, value in env_config.items():
-        if key in SERVER_CONFIG:
-            SERVER_CONFIG[key] = value
+    SERVER_CONFIG.update({key: value for key, value in env_config.items() if key in SERVER_CONFIG})
     
     return env_config
 
 # 尝试从环境变量获取当前环境
 current_env = os.environ.get('APP_ENV', 'development')
 
+# 应用当前环境配置（幂等；模块重新加载时 SERVER_CONFIG 会被重建，需要重新应用）
 env_specific_config = load_env_config(current_env)
 
 # 导出所有配置变量
@@ -304,9 +406,14 @@ __all__ = [
     'OUTPUT_DIR',
     'SERVER_CONFIG',
     'FLASHCARD_CONFIG',
+    'TEMPLATE_FILE_BY_NAME',
+    'TEMPLATE_DESCRIPTIONS',
+    'resolve_template',
     'MARKDOWN_CONFIG',
     'JSON_VALIDATION_CONFIG',
+    'LOG_LEVEL',
     'LOGGING_CONFIG',
+    'configure_logging',
     'API_PATHS',
     'get_path',
     'ensure_directories',
@@ -8,125 +8,184 @@ including CSV files, JSON data, and creating HTML/PDF outputs.
 
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
+import functools
+import logging
+import os
+import re
+import sys
+from datetime import datetime
+from time import time
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union
 from fastmcp import FastMCP
 
-# Import handlers and utilities
-from src.handlers.card_generator import generate_flashcards
-from src.handlers.pdf_generator import generate_flashcards_pdf_async
-from src.utils.csv_reader import convert_csv_to_json_data
-from src.utils.json_validator import FlashcardData, validate_json_structure
-from config import FLASHCARD_CONFIG
+try:
+    import orjson  # optional C-accelerated encoder
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+# Handlers and utilities are imported inside each tool so that the markdown/jinja2/
+# playwright dependency graph is only loaded when a tool that needs it is invoked.
+from config import (
+    FLASHCARD_CONFIG,
+    OUTPUT_DIR as DEFAULT_OUTPUT_DIR,
+    TEMPLATE_DESCRIPTIONS,
+    TEMPLATE_FILE_BY_NAME,
+    configure_logging,
+)
 
 # Initialize FastMCP server
 mcp = FastMCP(name="FlashcardGenerator")
 
-@mcp.resource("resource://flashcard-templates")
-def get_flashcard_templates() -> str:
+
+# Tool/resource JSON is compact for machine consumers; set FLASHCARD_DEBUG=1 to pretty-print it
+_INDENT = 2 if os.environ.get("FLASHCARD_DEBUG") else None
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _INDENT else 0)
+
+
+def _dumps(obj: Any) -> str:
     """
-    Get available flashcard templates and their configurations.
-    
+    Serialize to JSON, using orjson when it is installed.
+
     Returns:
-        JSON string containing template information
+        JSON string (non-ASCII characters are kept as-is; indented only when FLASHCARD_DEBUG is set)
     """
-    try:
-        # 从配置中动态获取模板信息
-        templates = {
-            name: {
-                "name": name.capitalize(),
-                "description": details.get("description", f"{name.capitalize()} template"),
-            }
-            for name, details in FLASHCARD_CONFIG.get('available_templates', {}).items()
-        }
-        
-        # PDF布局目前是固定的，将来可以考虑也加入配置
-        layouts = {
-            "single": {
-                "name": "Single Card Layout",
-                "description": "One flashcard per page for detailed view",
-                "page_size": "A4",
-                "cards_per_page": 1,
-                "best_for": ["Teaching materials", "Large text content", "Detailed explanations"]
-            },
-            "a4_8": {
-                "name": "A4 Eight Cards Layout", 
-                "description": "Eight flashcards per A4 page for efficient printing",
-                "page_size": "A4",
-                "cards_per_page": 8,
-                "best_for": ["Bulk printing", "Study cards", "Portable learning"]
-            }
-        }
-        
-        # 从配置中动态获取主题信息
-        themes = FLASHCARD_CONFIG.get('available_themes', [])
-
-        return json.dumps({
-            "templates": templates,
-            "layouts": layouts,
-            "supported_formats": ["HTML", "PDF"],
-            "themes": themes
-        }, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        return json.dumps({
-            "error": f"Failed to load template information: {str(e)}",
-            "templates": {},
-            "layouts": {}
-        }, ensure_ascii=False, indent=2)
-
-# Comprehensive Flashcard Assistant Prompt
-@mcp.prompt
-def flashcard_assistant(
-    user_input: str, 
-    context: str = "general", 
-    data_type: str = "unknown",
-    output_preference: str = "auto"
-) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            # orjson 不支持的类型（如超出 64 位的整数）交给标准库处理
+            pass
+    if _INDENT:
+        return json.dumps(obj, ensure_ascii=False, indent=_INDENT)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Filename sanitization patterns for generated PDFs, compiled once
+_SAFE_CHARS = re.compile(r'[^\w\s-]')
+_SAFE_SEP = re.compile(r'[-\s]+')
+
+# Card style applied to CSV imports; only the colors differ between the light and dark variants
+_CSV_STYLE_BASE = {
+    "font": "Arial, sans-serif",
+    "card_front_font": "24px/1.2 Arial, sans-serif",
+    "card_back_font": "18px/1.2 Arial, sans-serif",
+    "card_width": "300px",
+    "card_height": "200px",
+    "card_front_text_align": "center",
+    "card_back_text_align": "center",
+    "card_border_radius": "8px",
+    "card_padding": "20px",
+    "card_box_shadow": "0 2px 4px rgba(0,0,0,0.1)"
+}
+_CSV_STYLE_LIGHT = MappingProxyType(dict(
+    _CSV_STYLE_BASE,
+    card_front_background="#ffffff",
+    card_back_background="#f5f5f5",
+    card_border="1px solid #dddddd"
+))
+_CSV_STYLE_DARK = MappingProxyType(dict(
+    _CSV_STYLE_BASE,
+    card_front_background="#2d2d2d",
+    card_back_background="#3d3d3d",
+    card_border="1px solid #555555"
+))
+
+@functools.lru_cache(maxsize=256)
+def _safe_title(title: str) -> str:
     """
-    Comprehensive flashcard generation assistant with resource querying, intent recognition, and tool recommendation capabilities.
-    
-    Args:
-        user_input: User's input text describing their flashcard needs
-        context: Context information (general, learning, teaching, sharing, printing)
-        data_type: Type of input data (csv, json)
-        output_preference: Preferred output format (html, pdf, auto)
-    
+    Sanitize a deck title into a filename stem; repeated exports of the same deck reuse the result.
+
     Returns:
-        Complete analysis and recommendations for flashcard generation
+        Title with punctuation removed and whitespace/dash runs collapsed to '_' ("flashcards" if empty)
     """
-    # 从配置动态生成模板和布局的帮助信息
-    templates_info = "\n".join(
-        [f"- **{name}**: {details.get('description', 'No description available.')}" for name, details in FLASHCARD_CONFIG.get('available_templates', {}).items()]
-    )
-    
-    # 布局信息保持静态
-    layouts_info = """- **single**: One flashcard per page for detailed view
+    safe_title = _SAFE_SEP.sub('_', _SAFE_CHARS.sub('', title).strip())
+    return safe_title or "flashcards"
+
+
+# PDF layouts are fixed; defined once at import rather than per resource fetch
+_PDF_LAYOUTS = {
+    "single": {
+        "name": "Single Card Layout",
+        "description": "One flashcard per page for detailed view",
+        "page_size": "A4",
+        "cards_per_page": 1,
+        "best_for": ["Teaching materials", "Large text content", "Detailed explanations"]
+    },
+    "a4_8": {
+        "name": "A4 Eight Cards Layout",
+        "description": "Eight flashcards per A4 page for efficient printing",
+        "page_size": "A4",
+        "cards_per_page": 8,
+        "best_for": ["Bulk printing", "Study cards", "Portable learning"]
+    }
+}
+
+
+# Template catalog: display name and description per configured template
+_TEMPLATE_CATALOG = {
+    name: {
+        "name": name.capitalize(),
+        "description": TEMPLATE_DESCRIPTIONS.get(name, f"{name.capitalize()} template"),
+    }
+    for name in TEMPLATE_FILE_BY_NAME
+}
+
+# The templates resource is a pure function of import-time constants; serialize it once
+try:
+    _TEMPLATES_JSON = _dumps({
+        "templates": _TEMPLATE_CATALOG,
+        # PDF布局目前是固定的，将来可以考虑也加入配置
+        "layouts": _PDF_LAYOUTS,
+        "supported_formats": ["HTML", "PDF"],
+        # 从配置中动态获取主题信息
+        "themes": FLASHCARD_CONFIG.get('available_themes', [])
+    })
+except Exception as e:
+    _TEMPLATES_JSON = _dumps({
+        "error": f"Failed to load template information: {str(e)}",
+        "templates": {},
+        "layouts": {}
+    })
+
+
+# Help sections embedded in the assistant prompt; built once from the static config
+_TEMPLATES_INFO_MD = "\n".join(
+    [f"- **{name}**: {TEMPLATE_DESCRIPTIONS.get(name, 'No description available.')}" for name in TEMPLATE_FILE_BY_NAME]
+)
+
+_LAYOUTS_INFO_MD = """- **single**: One flashcard per page for detailed view
   - Best for: Teaching materials, large text content, detailed explanations
   
 - **a4_8**: Eight flashcards per A4 page for efficient printing
   - Best for: Bulk printing, study cards, portable learning"""
 
-    # 从配置动态生成主题的帮助信息
-    themes_info = ", ".join(FLASHCARD_CONFIG.get('available_themes', []))
+_THEMES_INFO = ", ".join(FLASHCARD_CONFIG.get('available_themes', []))
 
-    return f"""# Flashcard Generation Assistant
 
-## User Request Analysis
-**Input**: "{user_input}"
-**Context**: {context}
-**Data Type**: {data_type}
-**Output Preference**: {output_preference}
+@mcp.resource("resource://flashcard-templates", mime_type="application/json")
+def get_flashcard_templates() -> str:
+    """
+    Get available flashcard templates and their configurations.
+    
+    Returns:
+        JSON string containing template information
+    """
+    return _TEMPLATES_JSON
+
 
-## Available Resources Query
+# Everything after the per-request header is static; built once at import
+_ASSISTANT_BODY = f"""## Available Resources Query
 
 ### Templates Available:
-{templates_info}
+{_TEMPLATES_INFO_MD}
 
 ### PDF Layouts Available:
-{layouts_info}
+{_LAYOUTS_INFO_MD}
 
 ### Themes Available:
-- {themes_info}
+- {_THEMES_INFO}
 
 ## Intent Recognition & Analysis
 
@@ -188,6 +247,44 @@ When creating flashcard content using Markdown, please pay attention to the foll
 **Next Steps**: Based on this analysis, please proceed with the recommended tool calls using the suggested parameters.
 """
 
+# Full prompt as a single format template; literal braces in the static body are escaped
+_ASSISTANT_TMPL = """# Flashcard Generation Assistant
+
+## User Request Analysis
+**Input**: "{user_input}"
+**Context**: {context}
+**Data Type**: {data_type}
+**Output Preference**: {output_preference}
+
+""" + _ASSISTANT_BODY.replace("{", "{{").replace("}", "}}")
+
+# Comprehensive Flashcard Assistant Prompt
+@mcp.prompt
+def flashcard_assistant(
+    user_input: str, 
+    context: str = "general", 
+    data_type: str = "unknown",
+    output_preference: str = "auto"
+) -> str:
+    """
+    Comprehensive flashcard generation assistant with resource querying, intent recognition, and tool recommendation capabilities.
+    
+    Args:
+        user_input: User's input text describing their flashcard needs
+        context: Context information (general, learning, teaching, sharing, printing)
+        data_type: Type of input data (csv, json)
+        output_preference: Preferred output format (html, pdf, auto)
+    
+    Returns:
+        Complete analysis and recommendations for flashcard generation
+    """
+    return _ASSISTANT_TMPL.format(
+        user_input=user_input,
+        context=context,
+        data_type=data_type,
+        output_preference=output_preference
+    )
+
 @mcp.tool
 def create_flashcards_from_json(
     cards: List[Dict[str, Any]],
@@ -210,6 +307,8 @@ def create_flashcards_from_json(
         HTML content as string
     """
     try:
+        from src.handlers.card_generator import generate_flashcards
+
         # Prepare flashcard data structure
         flashcard_data = {
             "metadata": {
@@ -230,6 +329,51 @@ def create_flashcards_from_json(
     except Exception as e:
         raise ValueError(f"Flashcard generation failed: {str(e)}")
 
+# Filename suffix per PDF layout; unknown layouts render as a4_8 and share its suffix
+_LAYOUT_SUFFIX = MappingProxyType({"single": "单页布局", "a4_8": "8卡片布局"})
+
+# Output directories already created in this process; skips the mkdir/stat syscalls on repeat exports
+_READY_OUTPUT_DIRS = set()
+
+
+# POSIX: write the PDF through a raw fd, skipping the BufferedWriter copy; other platforms keep open()
+_RAW_WRITE = os.name == "posix"
+_RAW_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _open_and_write(file_path: str, pdf_bytes: bytes) -> None:
+    """
+    Write the PDF bytes to file_path in one shot.
+    """
+    if not _RAW_WRITE:
+        with open(file_path, 'wb') as f:
+            f.write(pdf_bytes)
+        return
+    fd = os.open(file_path, _RAW_WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(pdf_bytes)
+        while view:
+            # os.write may write fewer bytes than requested; continue with the remainder
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_pdf(output_path: str, file_path: str, pdf_bytes: bytes) -> None:
+    """
+    Ensure the output directory exists and write the PDF (blocking; run via asyncio.to_thread).
+    """
+    if output_path not in _READY_OUTPUT_DIRS:
+        os.makedirs(output_path, exist_ok=True)
+        _READY_OUTPUT_DIRS.add(output_path)
+    try:
+        _open_and_write(file_path, pdf_bytes)
+    except FileNotFoundError:
+        # The directory was removed after it was first created; recreate it once
+        os.makedirs(output_path, exist_ok=True)
+        _open_and_write(file_path, pdf_bytes)
+
+
 @mcp.tool
 async def generate_flashcards_pdf(
     cards: List[Dict[str, Any]],
@@ -253,11 +397,10 @@ async def generate_flashcards_pdf(
         show_card_index: Whether to show the card index on the PDF
     
     Returns:
-        Success message with file path and size information
+        JSON string: {"success": true, "path": <saved file path>, "size": <PDF size in bytes>}
     """
     try:
-        import os
-        import re
+        from src.handlers.pdf_generator import generate_flashcards_pdf_async
         
         # Prepare flashcard data structure
         flashcard_data = {
@@ -278,34 +421,106 @@ async def generate_flashcards_pdf(
         pdf_bytes = await generate_flashcards_pdf_async(flashcard_data, layout)
         
         # Determine output directory (default to config.OUTPUT_DIR)
-        try:
-            from config import OUTPUT_DIR as DEFAULT_OUTPUT_DIR
-        except Exception:
-            DEFAULT_OUTPUT_DIR = "test_output"
         output_path = output_path or DEFAULT_OUTPUT_DIR
-        # Ensure output directory exists
-        os.makedirs(output_path, exist_ok=True)
         
         # Create safe filename
-        safe_title = re.sub(r'[^\w\s-]', '', title).strip()
-        safe_title = re.sub(r'[-\s]+', '_', safe_title)
-        if not safe_title:
-            safe_title = "flashcards"
+        safe_title = _safe_title(title)
         
         # Add layout suffix for clarity
-        layout_suffix = "单页布局" if layout == "single" else "8卡片布局"
+        layout_suffix = _LAYOUT_SUFFIX.get(layout, _LAYOUT_SUFFIX["a4_8"])
         filename = f"{safe_title}_{layout_suffix}.pdf"
         file_path = os.path.join(output_path, filename)
         
-        # Save PDF file
-        with open(file_path, 'wb') as f:
-            f.write(pdf_bytes)
+        # Save PDF file in a worker thread so the event loop keeps serving other requests
+        await asyncio.to_thread(_write_pdf, output_path, file_path, pdf_bytes)
         
-        return f"PDF文件已生成并保存到: {file_path} (大小: {len(pdf_bytes)} 字节)"
+        return _dumps({"success": True, "path": file_path, "size": len(pdf_bytes)})
 
     except Exception as e:
         raise ValueError(f"PDF generation failed: {str(e)}")
 
+@functools.lru_cache(maxsize=64)
+def _parse_cols(spec: str) -> tuple:
+    """
+    Parse a comma-separated column index spec such as "0,1" into a tuple of ints.
+
+    Raises:
+        ValueError: If any entry is not an integer
+    """
+    try:
+        return tuple(map(int, spec.split(",")))
+    except ValueError:
+        raise ValueError(f"Invalid column indices {spec!r}: expected comma-separated integers such as \"0,1\"")
+
+
+@functools.lru_cache(maxsize=64)
+def _convert_csv_cached(
+    csv_content: str,
+    front_columns: str,
+    back_columns: str,
+    tags_column: Optional[int],
+    has_header: bool,
+    title: str,
+    description: str,
+    column_separator: str,
+    template: str,
+    theme: str
+) -> str:
+    """
+    Convert and serialize CSV content once per distinct set of arguments.
+    Repeated conversions of the same CSV return the cached JSON string, including its original `created_at`.
+    
+    Returns:
+        JSON string of complete flashcard data
+    """
+    from src.utils.csv_reader import convert_csv_to_json_data_from_text
+    from src.utils.json_validator import validate_and_normalize
+
+    # Parse column indices (memoized per distinct spec)
+    front_col_indices = _parse_cols(front_columns)
+    back_col_indices = _parse_cols(back_columns)
+
+    # Convert CSV to basic JSON structure (parsed in memory, no temporary file).
+    # Normalization is deferred to the single validation pass over the final structure below.
+    basic_data = convert_csv_to_json_data_from_text(
+        csv_content,
+        front_columns=front_col_indices,
+        back_columns=back_col_indices,
+        tags_column_index=tags_column,
+        has_header=has_header,
+        title=title,
+        column_separator=column_separator,
+        normalize=False
+    )
+
+    # Create complete flashcard data structure around the parsed cards list (no copy)
+    complete_flashcard_data = {
+        "cards": basic_data["cards"],
+        "metadata": {
+            "title": title,
+            "description": description,
+            "version": "1.0.0",
+            "created_at": datetime.fromtimestamp(time()).isoformat(timespec="seconds")
+        },
+        # Theme-specific style defaults are prebuilt; only per-call fields are filled in
+        "style": dict(
+            _CSV_STYLE_LIGHT if theme == "light" else _CSV_STYLE_DARK,
+            template=template,
+            theme=theme,
+            colors={}
+        )
+    }
+    
+    # Validate and normalize the generated structure in one pass
+    try:
+        normalized_data = validate_and_normalize(complete_flashcard_data)
+    except ValueError as e:
+        raise ValueError(f"Generated JSON structure validation failed: {e}")
+    
+    # Return JSON string
+    return _dumps(normalized_data)
+
+
 @mcp.tool
 def convert_csv_to_json(
     csv_content: str,
@@ -338,93 +553,52 @@ def convert_csv_to_json(
         JSON string of complete flashcard data
     """
     try:
-        import tempfile
-        import os
-        from datetime import datetime
-        from src.utils.json_validator import normalize_json_data, validate_json_structure
-        
-        # Create temporary CSV file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(csv_content)
-            temp_file_path = temp_file.name
-
-        try:
-            # Parse column indices
-            front_col_indices = [int(x.strip()) for x in front_columns.split(',')]
-            back_col_indices = [int(x.strip()) for x in back_columns.split(',')]
-            
-            # Convert CSV to basic JSON structure
-            basic_data = convert_csv_to_json_data(
-                file_path=temp_file_path,
-                front_columns=front_col_indices,
-                back_columns=back_col_indices,
-                tags_column_index=tags_column,
-                has_header=has_header,
-                title=title,
-                column_separator=column_separator
-            )
-            
-            # Create complete flashcard data structure
-            complete_flashcard_data = {
-                "cards": basic_data.get("cards", []),
-                "metadata": {
-                    "title": title,
-                    "description": description,
-                    "version": "1.0.0",
-                    "created_at": datetime.now().isoformat()
-                },
-                "style": {
-                    "template": template,
-                    "theme": theme,
-                    "colors": {},
-                    "font": "Arial, sans-serif",
-                    "card_front_font": "24px/1.2 Arial, sans-serif",
-                    "card_back_font": "18px/1.2 Arial, sans-serif",
-                    "card_width": "300px",
-                    "card_height": "200px",
-                    "card_front_background": "#ffffff" if theme == "light" else "#2d2d2d",
-                    "card_back_background": "#f5f5f5" if theme == "light" else "#3d3d3d",
-                    "card_front_text_align": "center",
-                    "card_back_text_align": "center",
-                    "card_border": "1px solid #dddddd" if theme == "light" else "1px solid #555555",
-                    "card_border_radius": "8px",
-                    "card_padding": "20px",
-                    "card_box_shadow": "0 2px 4px rgba(0,0,0,0.1)"
-                }
-            }
-            
-            # Validate the generated structure
-            validation_result = validate_json_structure(complete_flashcard_data)
-            if not validation_result.get('is_valid', False):
-                raise ValueError(f"Generated JSON structure validation failed: {validation_result.get('error', 'Unknown error')}")
-            
-            # Normalize the data
-            normalized_data = normalize_json_data(complete_flashcard_data)
-            
-            # Return JSON string
-            return json.dumps(normalized_data, ensure_ascii=False, indent=2)
-
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_file_path)
-
+        return _convert_csv_cached(
+            csv_content, front_columns, back_columns, tags_column, has_header,
+            title, description, column_separator, template, theme
+        )
     except Exception as e:
         raise ValueError(f"CSV conversion failed: {str(e)}")
 
+def _shape_error(flashcard_json: Any) -> Optional[str]:
+    """
+    Cheap structural pre-check for validate_flashcard_data.
+    Returns an error message for obviously malformed input, or None when the full validator must decide.
+    Only rejections are short-circuited; anything that passes still goes through the Pydantic model.
+    """
+    if not isinstance(flashcard_json, dict):
+        return f"expected a JSON object, got {type(flashcard_json).__name__}"
+    cards = flashcard_json.get("cards")
+    if not isinstance(cards, (list, tuple)):
+        return "'cards' must be a list of card objects"
+    if not cards:
+        return "闪卡列表不能为空 (the cards list must not be empty)"
+    return None
+
+
 @mcp.tool
-def validate_flashcard_data(flashcard_json: Dict[str, Any]) -> str:
+def validate_flashcard_data(flashcard_json: Union[Dict[str, Any], str]) -> str:
     """
     Validate flashcard JSON data structure.
     
     Args:
-        flashcard_json: Flashcard data in JSON format
+        flashcard_json: Flashcard data in JSON format (an object, or the raw JSON text)
     
     Returns:
         Validation result message
     """
     try:
-        # Perform validation
-        validation_result = validate_json_structure(flashcard_json)
+        from src.utils.json_validator import validate_json_structure, validate_json_text
+
+        # Perform validation; raw JSON text is parsed and validated in one pass
+        if isinstance(flashcard_json, str):
+            validation_result = validate_json_text(flashcard_json)
+        else:
+            # Malformed shapes fail fast without hashing the payload or running the model
+            shape_error = _shape_error(flashcard_json)
+            if shape_error is not None:
+                return f"❌ Flashcard data structure validation failed: {shape_error}"
+            validation_result = validate_json_structure(flashcard_json)
 
         if isinstance(validation_result, dict):
             if validation_result.get('is_valid', False):
@@ -439,5 +613,19 @@ def validate_flashcard_data(flashcard_json: Dict[str, Any]) -> str:
         return f"❌ Error occurred during validation: {str(e)}"
 
 if __name__ == "__main__":
+    # Opt-in file logging: set FLASHCARD_LOG_FILE=1 to write project logs to logs/app.log via the background queue
+    if os.environ.get("FLASHCARD_LOG_FILE", "").strip().lower() in ("1", "true", "yes", "on"):
+        configure_logging()
+        logging.getLogger('mcp').info("Starting FlashcardGenerator MCP server")
+
+    # Use the libuv-backed event loop when uvloop is installed (not available on Windows)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.install()
+
     # Run the MCP server
     mcp.run()
\ No newline at end of file
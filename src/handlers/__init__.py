@@ -1,9 +1,11 @@
 # handlers 模块初始化文件
 
 # 从子模块导入所有公开的函数和类
-from .card_generator import generate_flashcards
+from .card_generator import generate_flashcards, generate_flashcards_batch, stream_flashcards
 
 # 定义模块的公开接口
 __all__ = [
-    "generate_flashcards"
+    "generate_flashcards",
+    "generate_flashcards_batch",
+    "stream_flashcards"
 ]
\ No newline at end of file
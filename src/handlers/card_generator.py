@@ -1,25 +1,188 @@
-from src.utils.json_validator import validate_json_structure, normalize_json_data
+from src.utils.json_validator import validate_and_normalize, flashcard_cache_key
 from src.utils.markdown_parser import MarkdownParser
+import functools
 import os
-from config import FLASHCARD_CONFIG, TEMPLATES_DIR
-from jinja2 import Template, Environment, FileSystemLoader
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from config import FLASHCARD_CONFIG, TEMPLATES_DIR, TEMPLATE_FILE_BY_NAME, resolve_template
+from jinja2 import Environment, FileSystemLoader
 
 # 模板目录路径 - 使用 config.py 中的配置
 _template_dir = TEMPLATES_DIR
 
+# 进程内共享的 Jinja2 环境：模板只解析编译一次；父模板（如 base.html）运行期不检查文件更新，修改后需重启
+_JINJA_ENV = Environment(loader=FileSystemLoader(_template_dir), auto_reload=False)
 
-def generate_flashcards(json_data):
+# 进程内共享的 Markdown 解析器；markdown.Markdown 实例不是线程安全的，仅在未命中缓存时加锁解析
+_MD = MarkdownParser()
+_MD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
+def _md_parse(markdown_text):
     """
-    生成闪卡 HTML 内容。
+    将 Markdown 转换为 HTML，按原文缓存：重复出现的卡片内容（空背面、相同的模板文字等）只解析一次。
 
-    Generate flashcard HTML content.
+    Converts Markdown to HTML, cached by source text so repeated card content (empty backs, boilerplate) is parsed once.
+    """
+    with _MD_LOCK:
+        return _MD.parse(markdown_text)
+
+
+# 已渲染 HTML 的 LRU 缓存：相同的闪卡数据直接复用渲染结果
+# 设置环境变量 FLASHCARD_HTML_CACHE=0 可关闭（例如调试模板时）
+_HTML_CACHE_ENABLED = os.environ.get('FLASHCARD_HTML_CACHE', '1') != '0'
+_HTML_CACHE_MAXSIZE = 128
+_HTML_CACHE = OrderedDict()
+# 流式渲染的写入发生在 Starlette 线程池中，读取在事件循环线程；OrderedDict 的组合操作需要加锁
+_HTML_CACHE_LOCK = threading.Lock()
+
+
+def _html_cache_key(json_data):
     """
-    # 验证并规范化 JSON 数据
-    is_valid, errors = validate_json_structure(json_data)
-    if not is_valid:
-        raise ValueError(f"Invalid JSON structure: {errors}")
+    计算 HTML 缓存键（数据键 + 所用模板文件的路径与修改时间）；缓存关闭或数据无法计算键时返回 None。
+    模板文件被修改后键随之变化，相同数据也会重新渲染。
+    """
+    if not _HTML_CACHE_ENABLED:
+        return None
+    try:
+        return flashcard_cache_key(json_data), _template_stamp(json_data)
+    except (TypeError, ValueError, AttributeError):
+        return None
+
 
-    normalized_data = normalize_json_data(json_data)
+def _template_stamp(json_data):
+    """
+    返回数据所用模板文件的 (路径, 修改时间)，解析顺序与 _load_template 一致（请求的模板，其次默认模板）；都不可用时返回 None。
+    """
+    style = json_data.get('style')
+    # 未指定模板时与 Style 模型的默认值一致
+    template = style.get('template', 'minimal') if isinstance(style, dict) else 'minimal'
+    for name in (template, FLASHCARD_CONFIG.get('default_template_name', 'default')):
+        template_path = resolve_template(name)
+        if template_path:
+            try:
+                return template_path, os.stat(template_path).st_mtime_ns
+            except OSError:
+                pass
+    return None
+
+
+def _html_cache_get(key):
+    """读取缓存并将命中项移到末尾（最近使用）。"""
+    with _HTML_CACHE_LOCK:
+        html_content = _HTML_CACHE.get(key)
+        if html_content is not None:
+            _HTML_CACHE.move_to_end(key)
+    return html_content
+
+
+def _html_cache_put(key, html_content):
+    """写入缓存，超出容量时淘汰最久未使用的项。"""
+    with _HTML_CACHE_LOCK:
+        _HTML_CACHE[key] = html_content
+        _HTML_CACHE.move_to_end(key)
+        while len(_HTML_CACHE) > _HTML_CACHE_MAXSIZE:
+            _HTML_CACHE.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_template_file(path, mtime_ns):
+    """按 (路径, 修改时间) 缓存模板文件内容；文件被修改后修改时间变化，自动重新读取。"""
+    with open(path, 'r', encoding='utf-8', buffering=131072) as f:
+        return f.read()
+
+
+def _template_source(path):
+    """
+    每次调用只做一次 stat；内容未变化时直接返回缓存，文件不存在时抛出 OSError。
+
+    Stats the file once per call and returns the cached content while it is unchanged; raises OSError if it is missing.
+    """
+    return _read_template_file(path, os.stat(path).st_mtime_ns)
+
+
+def _load_template(template):
+    """
+    按模板名称加载并编译 Jinja2 模板；找不到时回退到配置中的默认模板。
+    模板内容按修改时间缓存、编译结果按内容缓存，重复渲染只需一次 stat；修改模板文件后自动生效
+    （HTML 缓存键包含模板修改时间；继承的父模板修改后仍需重启）。
+
+    Loads and compiles the Jinja2 template for the given name, falling back to the configured default template.
+    Contents are cached by modification time and compiled templates by content, so a warm render costs a single stat
+    and edited template files are picked up automatically (the rendered-HTML cache key includes the template's mtime;
+    parent templates used via `{% extends %}` still require a restart).
+
+    Args:
+        template (str): 模板名称（例如 'minimal'）。
+                        Name of the template (e.g., 'minimal').
+
+    Returns:
+        jinja2.Template: 编译后的模板对象。
+                         The compiled template object.
+
+    Raises:
+        ValueError: 请求的模板和默认模板都不可用时抛出。
+                    If neither the requested template nor the default template is available.
+    """
+    template_filename, template_content = _load_template_source(template)
+
+    # 如果没有找到模板，使用 config 中的默认模板名称回退到 'available_templates' 对应模板
+    if not template_content:
+        template = FLASHCARD_CONFIG.get('default_template_name', 'default')
+        template_filename, template_content = _load_template_source(template)
+
+    # 如果还是没有找到模板内容，抛出异常
+    if not template_content:
+        raise ValueError(f"No template found for '{template}' and default template is also unavailable")
+
+    return _get_template(template_filename, template_content)
+
+
+def _load_template_source(template):
+    """
+    读取模板名称对应的文件名与内容（内容按修改时间缓存）；模板未配置或文件不可读时返回 (None, None)。
+
+    Returns the configured file name and content for a template name (content cached by mtime),
+    or (None, None) if the template is not configured or its file cannot be read.
+    """
+    template_path = resolve_template(template)
+    if not template_path:
+        return None, None
+    try:
+        return TEMPLATE_FILE_BY_NAME[template], _template_source(template_path)
+    except OSError:
+        return None, None
+
+
+@functools.lru_cache(maxsize=32)
+def _get_template(template_filename, source):
+    """
+    在共享的 Jinja2 环境中编译模板源码，按 (文件名, 内容) 缓存；继承的父模板由环境的加载器加载并缓存。
+
+    Compiles template source in the shared Jinja2 environment, cached per (file name, content);
+    parent templates used via `{% extends %}` are loaded and cached by the environment's loader.
+    """
+    code = _JINJA_ENV.compile(source, template_filename, template_filename)
+    return _JINJA_ENV.template_class.from_code(_JINJA_ENV, code, _JINJA_ENV.make_globals(None))
+
+
+def _prepare_flashcards(json_data, skip_validation=False):
+    """
+    验证、规范化闪卡数据并转换 Markdown，返回模板对象与渲染上下文。
+
+    Validates and normalizes the flashcard data, converts Markdown, and returns the template and its render context.
+    """
+    if skip_validation:
+        # 调用方已通过 validate_and_normalize 得到规范化数据
+        normalized_data = json_data
+    else:
+        # 一次遍历完成验证与规范化（结果与验证缓存共享，只读）
+        try:
+            normalized_data = validate_and_normalize(json_data)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON structure: {e}")
 
     # 解析元数据
     metadata = normalized_data.get('metadata', {})
@@ -31,26 +194,23 @@ def generate_flashcards(json_data):
     # 使用 config 中的默认模板名称作为回退
     template = style_config.get('template', FLASHCARD_CONFIG.get('default_template_name', 'minimal'))
 
-    # 准备模板上下文
-    md_parser = MarkdownParser()
-    
-    # 提取闪卡数据并转换 Markdown
+    # 提取闪卡数据并批量转换 Markdown（共享解析器，结果按原文缓存）；空卡组不触及解析器
+    raw_cards = normalized_data.get('cards') or []
     cards = []
-    for card_data in normalized_data.get('cards', []):
-        card_id = card_data.get('id', f"card-{len(cards) + 1}")
-        front_content = md_parser.parse(card_data.get('front', ''))
-        back_content = md_parser.parse(card_data.get('back', ''))
-        tags = card_data.get('tags', [])
-        
-        cards.append({
-            'id': card_id,
-            'front': front_content,
-            'back': back_content,
-            'tags': tags
-        })
+    if raw_cards:
+        fronts = list(map(_md_parse, [c.get('front', '') for c in raw_cards]))
+        backs = list(map(_md_parse, [c.get('back', '') for c in raw_cards]))
+        cards = [
+            {
+                'id': card_data.get('id', f"card-{i + 1}"),
+                'front': front_content,
+                'back': back_content,
+                'tags': card_data.get('tags', [])
+            }
+            for i, (card_data, front_content, back_content) in enumerate(zip(raw_cards, fronts, backs))
+        ]
     
-    # 生成 HTML 内容
-    html_content = render_flashcard_template(
+    return _prepare_flashcard_template(
         title=title,
         description=description,
         cards=cards,
@@ -58,10 +218,107 @@ def generate_flashcards(json_data):
         style_params=style_config,
         deck_name=title
     )
+
+
+def generate_flashcards(json_data, *, skip_validation=False):
+    """
+    生成闪卡 HTML 内容。
+
+    Generate flashcard HTML content.
+
+    Args:
+        json_data (dict): 闪卡数据。
+                          Flashcard data.
+        skip_validation (bool): 数据已由 `validate_and_normalize` 规范化时设为 True，跳过重复验证。默认为 False。
+                                Set to True when the data was already normalized by `validate_and_normalize`,
+                                to skip validating it again. Defaults to False.
+
+    Returns:
+        str: 渲染后的 HTML 字符串。
+             Rendered HTML string.
+    """
+    # 相同数据命中缓存时跳过验证与渲染
+    cache_key = _html_cache_key(json_data)
+    if cache_key is not None:
+        cached = _html_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    # 生成 HTML 内容
+    tmpl, context = _prepare_flashcards(json_data, skip_validation)
+    html_content = tmpl.render(context)
+
+    if cache_key is not None:
+        _html_cache_put(cache_key, html_content)
     
     return html_content
 
 
+def generate_flashcards_batch(json_data_list):
+    """
+    批量生成多个闪卡集的 HTML：先验证全部数据（任一无效即在渲染前报错），再依次渲染，
+    各卡组共享已编译的模板与 Markdown 缓存。
+
+    Generates HTML for several flashcard sets: all inputs are validated first (any invalid set fails before rendering starts),
+    then each set is rendered, sharing the compiled templates and Markdown cache across sets.
+
+    Args:
+        json_data_list (Iterable[dict]): 闪卡数据列表。
+                                         Flashcard data sets.
+
+    Returns:
+        list: 与输入顺序一致的 HTML 字符串列表。
+              HTML strings in input order.
+
+    Raises:
+        ValueError: 任一数据无效时抛出，消息中包含其序号。
+                    If any set is invalid; the message includes its index.
+    """
+    normalized_list = []
+    for index, json_data in enumerate(json_data_list):
+        try:
+            normalized_list.append(validate_and_normalize(json_data))
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON structure in flashcard set {index}: {e}")
+
+    return [generate_flashcards(data, skip_validation=True) for data in normalized_list]
+
+
+def stream_flashcards(json_data):
+    """
+    以文本块的形式流式生成闪卡 HTML，适用于 StreamingResponse：首个块在整页渲染完成前即可发送。
+    验证与模板加载在调用时立即执行（错误在开始发送前抛出）；完整输出会写入与 `generate_flashcards` 共用的缓存。
+
+    Streams the flashcard HTML as text chunks, suitable for a StreamingResponse: the first chunk can be sent before the whole page
+    is rendered. Validation and template loading run eagerly, so errors are raised before streaming starts; the complete output is
+    stored in the cache shared with `generate_flashcards`.
+
+    Returns:
+        Iterator[str]: HTML 文本块。
+                       HTML text chunks.
+    """
+    cache_key = _html_cache_key(json_data)
+    if cache_key is not None:
+        cached = _html_cache_get(cache_key)
+        if cached is not None:
+            return iter((cached,))
+
+    tmpl, context = _prepare_flashcards(json_data)
+    chunks = tmpl.generate(context)
+    if cache_key is None:
+        return chunks
+    return _collect_into_cache(chunks, cache_key)
+
+
+def _collect_into_cache(chunks, cache_key):
+    """逐块转发渲染结果，全部发送完成后写入 HTML 缓存。"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    _html_cache_put(cache_key, "".join(parts))
+
+
 def render_flashcard_template(title, description, cards, template='minimal', style_params=None, deck_name='FlashCard'):
     """
     渲染闪卡模板，将闪卡数据、元数据和样式参数组合成 HTML 字符串。
@@ -86,115 +343,122 @@ def render_flashcard_template(title, description, cards, template='minimal', sty
         str: 渲染后的 HTML 字符串。
              Rendered HTML string.
     """
+    tmpl, context = _prepare_flashcard_template(title, description, cards, template, style_params, deck_name)
+    return tmpl.render(context)
 
-    
-    # 获取模板配置
-    available_templates = FLASHCARD_CONFIG.get('available_templates', {})
-    
-    # 尝试从配置中获取模板文件路径
-    template_file = None
-    if template in available_templates:
-        template_config = available_templates[template]
-        # 适配新的配置结构：模板配置现在是字典，包含file_path字段
-        if isinstance(template_config, dict):
-            template_file = template_config.get('file_path')
-        else:
-            # 兼容旧的配置结构：直接是文件名字符串
-            template_file = template_config
-    else:
-        pass
-    
-    # 尝试加载模板文件
-    template_content = None
-    if template_file:
-        template_path = os.path.join(_template_dir, template_file)
-        if os.path.exists(template_path):
-            try:
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template_content = f.read()
-            except Exception as e:
-                pass
-        else:
-            pass
-    
-    # 如果仍然没有找到模板，使用 config 中的默认模板名称回退到 'available_templates' 对应模板
-    if not template_content:
-        fallback_template_name = FLASHCARD_CONFIG.get('default_template_name', 'default')
-        template = fallback_template_name
-        template_config = available_templates.get(template, {})
-        if isinstance(template_config, dict):
-            template_file = template_config.get('file_path')
-        else:
-            template_file = template_config
-        
-        if template_file:
-            template_path = os.path.join(_template_dir, template_file)
-            if os.path.exists(template_path):
-                try:
-                    with open(template_path, 'r', encoding='utf-8') as f:
-                        template_content = f.read()
-                except Exception as e:
-                    pass
-            else:
-                pass
-        else:
-            pass
-    
-    # 如果还是没有找到模板内容，抛出异常
-    if not template_content:
-        raise ValueError(f"No template found for '{template}' and default template is also unavailable")
 
-    
+class _CardsHtml:
+    """
+    按需拼接的卡片 HTML 片段：只有模板实际输出 `{{ cards_html }}` 时才构建，结果在本次渲染内复用。
+
+    Lazily joined card HTML fragment: built only when a template actually outputs `{{ cards_html }}`, then reused for the render.
+    """
+    __slots__ = ('_cards', '_html')
+
+    def __init__(self, cards):
+        self._cards = cards
+        self._html = None
+
+    def __str__(self):
+        if self._html is None:
+            parts = []
+            append = parts.append
+            for c in self._cards:
+                append('<div class="card"><div class="card-front">')
+                append(c['front'])
+                append('</div><div class="card-back">')
+                append(c['back'])
+                append('</div></div>')
+            self._html = "".join(parts)
+        return self._html
+
+    def __bool__(self):
+        return bool(self._cards)
+
+
+# config 中的默认样式；按主题解析的默认值见 _resolve_theme_defaults
+_DEFAULT_STYLE = FLASHCARD_CONFIG.get('default_style', {})
+_DEFAULT_THEME = _DEFAULT_STYLE.get('theme', 'light')
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_theme_defaults(theme):
+    """
+    解析某个主题的渲染默认值（主题类、默认颜色及 config 默认样式中的显示设置），按主题缓存为只读映射。
+    渲染时只需叠加 style_params 中的用户设置。
+
+    Resolves the render defaults for a theme (theme class, default colors and the display settings from the
+    config default style), cached per theme as a read-only mapping; renders only overlay the user's style_params.
+    """
+    theme_config = FLASHCARD_CONFIG.get(f'{theme}_theme_style', FLASHCARD_CONFIG['default_style'])
+    return MappingProxyType({
+        'theme_class': f"theme-{theme}" if theme in ('basic', 'advance', 'detail') else ("theme-dark" if theme == 'dark' else 'theme-light'),
+        'colors': MappingProxyType(dict(theme_config.get('colors', FLASHCARD_CONFIG['default_style']['colors']))),
+        'show_deck_name': _DEFAULT_STYLE.get('show_deck_name', False),
+        'show_card_index': _DEFAULT_STYLE.get('show_card_index', False),
+        'show_tags': _DEFAULT_STYLE.get('show_tags', True),
+        'compact_typography': _DEFAULT_STYLE.get('compact_typography', True),
+        'front_char_limit': _DEFAULT_STYLE.get('front_char_limit'),
+        'back_char_limit': _DEFAULT_STYLE.get('back_char_limit'),
+        'card_width': _DEFAULT_STYLE.get('card_width'),
+        'card_height': _DEFAULT_STYLE.get('card_height'),
+        'font': _DEFAULT_STYLE.get('font', 'Arial, sans-serif'),
+    })
+
+
+def _prepare_flashcard_template(title, description, cards, template='minimal', style_params=None, deck_name='FlashCard'):
+    """
+    加载模板并构建渲染上下文，供一次性渲染与流式渲染共用。
+
+    Loads the template and builds the render context; shared by full and streamed rendering.
+
+    Returns:
+        tuple: (jinja2.Template, dict) 模板对象与上下文。
+               The template object and its context.
+    """
+    # 编译后的模板按内容缓存
+    tmpl = _load_template(template)
+
     # 初始化 style_params
     if style_params is None:
         style_params = {}
 
     # 从 style_params 中获取主题和颜色配置
-    # 优先使用 style_params，其次使用 config 的默认样式
-    default_style = FLASHCARD_CONFIG.get('default_style', {})
-    theme = style_params.get('theme', default_style.get('theme', 'light'))
+    # 优先使用 style_params，其次使用按主题预先解析的 config 默认值
+    theme = style_params.get('theme', _DEFAULT_THEME)
+    defaults = _resolve_theme_defaults(theme)
     colors = style_params.get('colors', {})
     # 新增：显示控制 & 紧凑排版 & 字数限制（统一回退到 config 默认）
-    show_deck_name = bool(style_params.get('show_deck_name', default_style.get('show_deck_name', False)))
-    show_card_index = bool(style_params.get('show_card_index', default_style.get('show_card_index', False)))
-    show_tags = bool(style_params.get('show_tags', default_style.get('show_tags', True)))
+    show_deck_name = bool(style_params.get('show_deck_name', defaults['show_deck_name']))
+    show_card_index = bool(style_params.get('show_card_index', defaults['show_card_index']))
+    show_tags = bool(style_params.get('show_tags', defaults['show_tags']))
     deck_name_style = style_params.get('deck_name_style', '')
     card_index_style = style_params.get('card_index_style', '')
-    compact_typography = bool(style_params.get('compact_typography', default_style.get('compact_typography', True)))
-    front_char_limit = style_params.get('front_char_limit') if style_params.get('front_char_limit') is not None else default_style.get('front_char_limit')
-    back_char_limit = style_params.get('back_char_limit') if style_params.get('back_char_limit') is not None else default_style.get('back_char_limit')
+    compact_typography = bool(style_params.get('compact_typography', defaults['compact_typography']))
+    front_char_limit = style_params.get('front_char_limit')
+    if front_char_limit is None:
+        front_char_limit = defaults['front_char_limit']
+    back_char_limit = style_params.get('back_char_limit')
+    if back_char_limit is None:
+        back_char_limit = defaults['back_char_limit']
     # 主题类（用于控制背面风格 basic/advance/detail，不更改尺寸）
-    theme_class = f"theme-{theme}" if theme in ['basic','advance','detail'] else ("theme-dark" if theme == 'dark' else 'theme-light')
-
-    # 设置默认颜色
-    default_colors = {
-        'primary': '#007bff',
-        'secondary': '#6c757d',
-        'background': '#ffffff' if theme != 'dark' else '#1a1a1a',
-        'text': '#333333' if theme != 'dark' else '#ffffff',
-        'card_bg': '#ffffff' if theme != 'dark' else '#2d2d2d',
-        'card_front_bg': '#ffffff',
-        'card_back_bg': '#f5f5f5',
-        'card_border': '#dddddd' if theme != 'dark' else '#444444'
-    }
+    theme_class = defaults['theme_class']
 
-    # 根据主题获取默认颜色
-    theme_style_key = f'{theme}_theme_style'
-    theme_config = FLASHCARD_CONFIG.get(theme_style_key, FLASHCARD_CONFIG['default_style'])
-    default_colors = theme_config.get('colors', FLASHCARD_CONFIG['default_style']['colors'])
-
-    # 合并用户自定义颜色和默认颜色
-    for key, value in default_colors.items():
-        if key in colors:
-            # 确保颜色值以#开头
-            color_value = colors[key]
-            if isinstance(color_value, str) and not color_value.startswith('#'):
-                color_value = '#' + color_value
-            default_colors[key] = color_value
+    # 根据主题获取默认颜色；没有自定义颜色时直接复用按主题缓存的只读映射
+    default_colors = defaults['colors']
+    if colors:
+        # 只遍历用户提供的颜色，合并到默认颜色的副本中
+        default_colors = dict(default_colors)
+        for key, color_value in colors.items():
+            if key in default_colors:
+                # 确保颜色值以#开头
+                if isinstance(color_value, str) and not color_value.startswith('#'):
+                    color_value = '#' + color_value
+                default_colors[key] = color_value
     
     # 从 style_params 中获取新的CSS样式值，如果不存在则使用默认值
-    card_width = style_params.get('card_width', default_style.get('card_width'))
-    card_height = style_params.get('card_height', default_style.get('card_height')) 
+    card_width = style_params.get('card_width', defaults['card_width'])
+    card_height = style_params.get('card_height', defaults['card_height'])
     card_front_text_align = style_params.get('card_front_text_align', 'center')
     card_back_text_align = style_params.get('card_back_text_align', 'left')
     card_border = style_params.get('card_border') or default_colors.get('card_border')
@@ -203,7 +467,7 @@ def render_flashcard_template(title, description, cards, template='minimal', sty
     card_box_shadow = style_params.get('card_box_shadow', '0 2px 4px rgba(0,0,0,0.1)')
 
     # 字体相关 - 支持CSS font简写，从font变量中提取字体族
-    font_css = style_params.get('font', default_style.get('font', 'Arial, sans-serif'))
+    font_css = style_params.get('font', defaults['font'])
     # 前后字体
     card_front_font = style_params.get('card_front_font')
     card_back_font = style_params.get('card_back_font')
@@ -211,9 +475,8 @@ def render_flashcard_template(title, description, cards, template='minimal', sty
     # 生成卡片HTML片段（简化预览环境）
     description_section = f"<p class=\"description\">{description}</p>" if description else ""
     filter_section = ""
-    cards_html = "".join([
-        f"<div class=\"card\"><div class=\"card-front\">{c['front']}</div><div class=\"card-back\">{c['back']}</div></div>" for c in cards
-    ])
+    # 内置模板直接遍历 cards；cards_html 仅为兼容自定义模板保留，按需拼接
+    cards_html = _CardsHtml(cards)
 
     context = {
         'title': title,
@@ -253,18 +516,4 @@ def render_flashcard_template(title, description, cards, template='minimal', sty
         'deck_name': deck_name
     }
 
-    # 检查是否使用模板继承
-    if template_content and '{% extends' in template_content:
-        # 使用 Environment 和 FileSystemLoader 来支持模板继承
-        env = Environment(loader=FileSystemLoader(_template_dir))
-        # 使用配置中的实际文件名而不是 template.html
-        template_config = FLASHCARD_CONFIG['available_templates'].get(template, {})
-        template_filename = template_config.get('file_path', f"{template}.html")
-        tmpl = env.get_template(template_filename)
-        rendered_html = tmpl.render(**context)
-    else:
-        # 使用传统的 Template 方式
-        tmpl = Template(template_content)
-        rendered_html = tmpl.render(**context)
-    
-    return rendered_html
+    return tmpl, context
@@ -5,16 +5,99 @@ PDF生成器模块
 
 import os
 import asyncio
-import base64
+import binascii
+import hashlib
+import logging
 import mimetypes
+import multiprocessing
 import re
+import threading
 import urllib.parse
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Hashable, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader
 
-from src.utils.json_validator import FlashcardData
+from src.utils.json_validator import FlashcardData, flashcard_cache_key
 from src.utils.markdown_parser import MarkdownParser
-from config import FLASHCARD_CONFIG  # 新增：引入默认样式配置
+from config import FLASHCARD_CONFIG, OUTPUT_DIR as DEFAULT_OUTPUT_DIR  # 默认样式配置与默认输出目录
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    """读取整数环境变量，未设置或无法解析（如 "auto"、空串）时记录警告并返回默认值。"""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, falling back to %d", name, raw, default)
+        return default
+
+
+# 已生成 PDF 的 LRU 缓存：相同的闪卡数据与布局直接复用字节结果
+# 设置环境变量 FLASHCARD_PDF_CACHE=0 可关闭
+_PDF_CACHE_ENABLED = os.environ.get('FLASHCARD_PDF_CACHE', '1') != '0'
+_PDF_CACHE_MAXSIZE = 32
+_PDF_CACHE: "OrderedDict[Hashable, bytes]" = OrderedDict()
+# 缓存可能同时被多个线程（线程池路由、asyncio.to_thread、同步包装器）访问，组合操作需要加锁
+_PDF_CACHE_LOCK = threading.Lock()
+
+
+def _pdf_cache_key(flashcard_data: dict, layout: str, html_content: str) -> Optional[Hashable]:
+    """
+    根据闪卡数据、布局与渲染出的 HTML 摘要计算缓存键，无法计算时返回 None（不缓存）。
+    HTML 已包含模板（含继承的父模板）输出与内联图片，修改模板或图片后键随之变化。
+
+    Computes the cache key from the flashcard data, layout and a digest of the rendered HTML, or None when the data cannot be keyed.
+    The HTML reflects the templates (including parents) and inlined images, so editing either changes the key.
+    """
+    try:
+        html_digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+        return (flashcard_cache_key(flashcard_data), layout, html_digest)
+    except (TypeError, ValueError):
+        return None
+
+
+# HTML 渲染进程池（可选，首次使用时创建）：默认在当前进程内渲染，设置 FLASHCARD_PDF_WORKERS=N 启用 N 个工作进程。
+# spawn 出的工作进程需重新导入整个依赖栈，各自的图片/Markdown 缓存也从空开始，只有多核且卡组很大时才值得启用。
+# 使用 spawn 上下文，避免在已有线程（日志监听、事件循环）的进程中 fork
+_RENDER_WORKERS = _env_int('FLASHCARD_PDF_WORKERS', 0)
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> Optional[ProcessPoolExecutor]:
+    """返回 HTML 渲染进程池，禁用时返回 None。"""
+    global _render_pool
+    if _render_pool is None and _RENDER_WORKERS > 0:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _render_pool
+
+
+def _pdf_cache_get(key: Hashable):
+    """读取缓存并将命中项移到末尾（最近使用）。"""
+    with _PDF_CACHE_LOCK:
+        pdf_bytes = _PDF_CACHE.get(key)
+        if pdf_bytes is not None:
+            _PDF_CACHE.move_to_end(key)
+    return pdf_bytes
+
+
+def _pdf_cache_put(key: Hashable, pdf_bytes: bytes) -> None:
+    """写入缓存，超出容量时淘汰最久未使用的项。"""
+    with _PDF_CACHE_LOCK:
+        _PDF_CACHE[key] = pdf_bytes
+        _PDF_CACHE.move_to_end(key)
+        while len(_PDF_CACHE) > _PDF_CACHE_MAXSIZE:
+            _PDF_CACHE.popitem(last=False)
 
 
 def get_template_path() -> str:
@@ -43,14 +126,28 @@ def _to_data_uri(path: str) -> str:
         mime = "application/octet-stream"
     with open(path, "rb") as f:
         data = f.read()
-    encoded = base64.b64encode(data).decode("ascii")
+    # b2a_base64 与 b64encode 同为 C 实现，但省去包装层；输出为纯 ASCII
+    encoded = binascii.b2a_base64(data, newline=False).decode("ascii")
     return f"data:{mime};base64,{encoded}"
 
 
+@lru_cache(maxsize=64)
+def _cached_data_uri(path: str, mtime_ns: int, size: int) -> str:
+    """按文件路径与版本（mtime、大小）缓存 data URI，同一图片在多张卡片中只读取并编码一次。"""
+    return _to_data_uri(path)
+
+
+# 图片内联与尺寸解析用到的路径和正则在导入时计算/编译一次
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent  # 项目根
+_STATIC_ROOT = _PROJECT_ROOT / "static"
+_IMG_SRC_RE = re.compile(r"<img\s[^>]*src=\"([^\"]+)\"")
+_NUMBER_RE = re.compile(r"[\d\.]+")
+
+
 def inline_images_in_html(html: str) -> str:
     """将 HTML 中本地或静态路径图片内联为 data URI，避免 PDF 环境加载失败。"""
-    root = Path(__file__).resolve().parent.parent.parent  # 项目根
-    static_dir = root / "static"
+    root = _PROJECT_ROOT
+    static_dir = _STATIC_ROOT
 
     def _resolve_local_path(src: str) -> str:
         # 已是 data/http(s) 则跳过
@@ -68,53 +165,40 @@ def inline_images_in_html(html: str) -> str:
         # 相对路径：按项目根尝试
         return str(root / src)
 
-    pattern = r"<img\s[^>]*src=\"([^\"]+)\""
-
     def _repl(m: re.Match) -> str:
         src = m.group(1)
         path = _resolve_local_path(src)
-        if path and os.path.exists(path):
-            try:
-                data_uri = _to_data_uri(path)
-                return m.group(0).replace(src, data_uri)
-            except Exception:
-                return m.group(0)  # 失败则保持原样
-        return m.group(0)
+        if not path:
+            return m.group(0)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return m.group(0)
+        try:
+            data_uri = _cached_data_uri(path, st.st_mtime_ns, st.st_size)
+            return m.group(0).replace(src, data_uri)
+        except Exception:
+            return m.group(0)  # 失败则保持原样
 
-    return re.sub(pattern, _repl, html)
+    return _IMG_SRC_RE.sub(_repl, html)
 
 
-async def generate_flashcards_pdf_async(
-    flashcard_data: dict,
-    layout: str = "a4_8"
- ) -> bytes:
+def _render_pdf_html(data: FlashcardData, layout: str) -> Tuple[str, dict]:
     """
-    异步生成闪卡 PDF 文件。
+    渲染 PDF 所用的 HTML（Markdown 转换、图片内联与模板渲染），可在进程池中执行。
 
-    Asynchronously generates a flashcard PDF file.
+    Renders the HTML used for the PDF (Markdown conversion, image inlining and template rendering); safe to run in a process pool.
 
     Args:
-        flashcard_data (dict): 包含闪卡数据、元数据和样式配置的字典。
-                               Dictionary containing flashcard data, metadata, and style configurations.
-        layout (str): PDF 布局类型，可以是 'single'（单张卡片一页）或 'a4_8'（A4 页面八张卡片）。默认为 "a4_8"。
-                      PDF layout type, can be 'single' (one card per page) or 'a4_8' (eight cards per A4 page). Defaults to "a4_8".
+        data (FlashcardData): 已验证的闪卡数据。
+                              Validated flashcard data.
+        layout (str): PDF 布局类型。
+                      PDF layout type.
 
     Returns:
-        bytes: 生成的 PDF 文件的字节数据。
-               Byte data of the generated PDF file.
-
-    Raises:
-        ValueError: 当输入数据验证失败时抛出。
-                    Raised when input data validation fails.
-        RuntimeError: 当 PDF 生成过程失败时抛出。
-                      Raised when the PDF generation process fails.
+        Tuple[str, dict]: 渲染后的 HTML 与最终样式参数。
+                          Rendered HTML and the final style parameters.
     """
-    # 验证和规范化数据
-    try:
-        data = FlashcardData(**flashcard_data)
-    except Exception as e:
-        raise ValueError(f"数据验证失败: {e}")
-    
     # 设置模板环境
     template_dir = get_template_path()
     env = Environment(loader=FileSystemLoader(template_dir))
@@ -123,16 +207,14 @@ async def generate_flashcards_pdf_async(
     # 初始化Markdown解析器
     markdown_parser = MarkdownParser()
     
-    # 处理卡片内容，将Markdown转换为HTML
-    processed_cards = []
-    for card in data.cards:
-        front_html = markdown_parser.parse(card.front)
-        back_html = markdown_parser.parse(card.back)
-        # 内联本地/静态图片，避免 PDF 环境加载失败
-        front_html = inline_images_in_html(front_html)
-        back_html = inline_images_in_html(back_html)
-        processed_card = {"front": front_html, "back": back_html}
-        processed_cards.append(processed_card)
+    # 处理卡片内容，将Markdown批量转换为HTML
+    fronts = markdown_parser.parse_many([card.front for card in data.cards])
+    backs = markdown_parser.parse_many([card.back for card in data.cards])
+    # 内联本地/静态图片，避免 PDF 环境加载失败
+    processed_cards = [
+        {"front": inline_images_in_html(front_html), "back": inline_images_in_html(back_html)}
+        for front_html, back_html in zip(fronts, backs)
+    ]
     
     # 如果是A4八卡片布局，补齐空白卡片以满足每页8张的要求
     if layout == "a4_8":
@@ -253,106 +335,263 @@ async def generate_flashcards_pdf_async(
         'style': style_params
     }
     
-    # 调试：打印最终的样式参数
-    print("--- DEBUG: Final Style Parameters for Template ---")
-    print(style_params)
-    print("-------------------------------------------------")
+    # 调试：记录最终的样式参数（经日志队列输出，不占用 stdout）
+    logger.debug("Final style parameters for template: %s", style_params)
 
     # 渲染HTML（继承 minimal.html，因此会复用相同的变量与样式）
-    html_content = template.render(**context)
-    
-    # 使用Playwright生成PDF
-    from playwright.async_api import async_playwright
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # 设置页面内容
-        await page.set_content(html_content, wait_until="domcontentloaded")
+    html_content = template.render(context)
+
+    return html_content, style_params
+
+
+# 共享的 Playwright 浏览器会话：首次生成 PDF 时在当前事件循环中启动 Chromium，之后的调用复用同一浏览器，
+# 省去每次导出的冷启动；FLASHCARD_PDF_CONCURRENCY 限制同时渲染的页面数
+_PDF_CONCURRENCY = max(1, _env_int('FLASHCARD_PDF_CONCURRENCY', 4))
 
-        # 等待外部资源：MathJax、图片与字体
+
+class _BrowserSession:
+    """绑定到单个事件循环的 Playwright 实例、浏览器与并发信号量（按事件循环存放在 _browser_sessions 中）。"""
+
+    def __init__(self, playwright, browser):
+        self.playwright = playwright
+        self.browser = browser
+        self.semaphore = asyncio.Semaphore(_PDF_CONCURRENCY)
+
+    async def close(self) -> None:
         try:
-            # 等待MathJax加载并完成排版（若存在）
-            await page.wait_for_function("() => window.MathJax && MathJax.typesetPromise", timeout=10000)
-            await page.evaluate("async () => { if (window.MathJax && MathJax.typesetPromise) { await MathJax.typesetPromise(); } }")
+            await self.browser.close()
+        finally:
+            await self.playwright.stop()
+
+
+# 每个事件循环各自的浏览器会话与启动任务：不同线程中的 asyncio.run 调用互不覆盖，
+# 事件循环被回收后对应条目自动移除；跨线程访问字典时加锁
+_browser_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _BrowserSession]" = weakref.WeakKeyDictionary()
+_browser_starting: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[_BrowserSession]]" = weakref.WeakKeyDictionary()
+_BROWSER_LOCK = threading.Lock()
+
+
+async def _launch_browser_session() -> _BrowserSession:
+    """启动 Playwright 与无头 Chromium。"""
+    from playwright.async_api import async_playwright
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True)
+    except BaseException:
+        await playwright.stop()
+        raise
+    return _BrowserSession(playwright, browser)
+
+
+async def _get_browser_session() -> _BrowserSession:
+    """返回当前事件循环的共享浏览器会话，必要时（首次调用或浏览器断开）重新启动。"""
+    loop = asyncio.get_running_loop()
+    with _BROWSER_LOCK:
+        session = _browser_sessions.get(loop)
+        if session is not None and not session.browser.is_connected():
+            # 浏览器已断开：移除会话，稍后释放旧的 Playwright 驱动
+            del _browser_sessions[loop]
+        elif session is not None:
+            return session
+    if session is not None:
+        try:
+            await session.playwright.stop()
         except Exception:
             pass
 
-        # 等待所有图片加载完成
+    # 同一事件循环中并发的首次调用共享同一个启动任务，避免重复启动浏览器
+    with _BROWSER_LOCK:
+        task = _browser_starting.get(loop)
+        if task is None:
+            task = _browser_starting[loop] = loop.create_task(_launch_browser_session())
+    try:
+        session = await asyncio.shield(task)
+    finally:
+        with _BROWSER_LOCK:
+            if _browser_starting.get(loop) is task and task.done():
+                del _browser_starting[loop]
+    with _BROWSER_LOCK:
+        _browser_sessions[loop] = session
+    return session
+
+
+async def close_pdf_browser() -> None:
+    """
+    关闭当前事件循环的浏览器会话；应在应用关闭时于启动它的事件循环中调用。
+    其他事件循环的会话由各自的循环关闭（同步包装器在 asyncio.run 结束前关闭自己的会话）。
+
+    Closes the current event loop's browser session; call it on application shutdown from the loop that started it.
+    Sessions of other loops are closed by their own loop (the sync wrapper closes its own before asyncio.run returns).
+    """
+    with _BROWSER_LOCK:
+        session = _browser_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def _render_pdf_html_async(data: FlashcardData, layout: str) -> Tuple[str, dict]:
+    """将 CPU 密集的 Markdown 转换与模板渲染放到进程池执行，避免阻塞事件循环。"""
+    pool = _get_render_pool()
+    if pool is None:
+        return _render_pdf_html(data, layout)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, _render_pdf_html, data, layout)
+
+
+async def generate_flashcards_pdf_async(
+    flashcard_data: dict,
+    layout: str = "a4_8"
+ ) -> bytes:
+    """
+    异步生成闪卡 PDF 文件。
+
+    Asynchronously generates a flashcard PDF file.
+
+    Args:
+        flashcard_data (dict): 包含闪卡数据、元数据和样式配置的字典。
+                               Dictionary containing flashcard data, metadata, and style configurations.
+        layout (str): PDF 布局类型，可以是 'single'（单张卡片一页）或 'a4_8'（A4 页面八张卡片）。默认为 "a4_8"。
+                      PDF layout type, can be 'single' (one card per page) or 'a4_8' (eight cards per A4 page). Defaults to "a4_8".
+
+    Returns:
+        bytes: 生成的 PDF 文件的字节数据。
+               Byte data of the generated PDF file.
+
+    Raises:
+        ValueError: 当输入数据验证失败时抛出。
+                    Raised when input data validation fails.
+        RuntimeError: 当 PDF 生成过程失败时抛出。
+                      Raised when the PDF generation process fails.
+    """
+    # 验证和规范化数据
+    try:
+        data = FlashcardData.model_validate(flashcard_data)
+    except Exception as e:
+        raise ValueError(f"数据验证失败: {e}")
+
+    # 复用共享的浏览器会话（首次调用时启动），与 HTML 渲染并行进行
+    session, rendered = await asyncio.gather(
+        _get_browser_session(),
+        _render_pdf_html_async(data, layout),
+        return_exceptions=True
+    )
+    if isinstance(rendered, BaseException):
+        raise rendered
+    if isinstance(session, BaseException):
+        raise session
+    html_content, style_params = rendered
+
+    # 相同数据、布局与 HTML 命中缓存时跳过浏览器渲染（浏览器渲染才是主要开销）
+    cache_key = _pdf_cache_key(flashcard_data, layout, html_content) if _PDF_CACHE_ENABLED else None
+    if cache_key is not None:
+        cached = _pdf_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    # 信号量限制同时渲染的页面数（背压）；每次导出使用独立的 BrowserContext，互不影响
+    async with session.semaphore:
+        context = await session.browser.new_context()
         try:
+            page = await context.new_page()
+            
+            # 设置页面内容
+            await page.set_content(html_content, wait_until="domcontentloaded")
+
+            # 等待外部资源：MathJax、图片与字体
+            try:
+                # 等待MathJax加载并完成排版（若存在）
+                await page.wait_for_function("() => window.MathJax && MathJax.typesetPromise", timeout=10000)
+                await page.evaluate("async () => { if (window.MathJax && MathJax.typesetPromise) { await MathJax.typesetPromise(); } }")
+            except Exception:
+                pass
+
+            # 等待所有图片加载完成
+            try:
+                await page.evaluate('''
+                    async () => {
+                        const images = Array.from(document.images);
+                        await Promise.all(images.map(img => {
+                            if (img.decode) return img.decode().catch(() => {});
+                            if (img.complete) return Promise.resolve();
+                            return new Promise(res => { img.onload = () => res(); img.onerror = () => res(); });
+                        }));
+                        if (document.fonts && document.fonts.ready) {
+                            await document.fonts.ready;
+                        }
+                    }
+                ''')
+            except Exception:
+                pass
+
+            # 注入JavaScript以动态调整字体大小（同时支持 single 与 a4_8 结构）
+            # 所有溢出的卡面在同一帧内同步缩小，每一步只等待一次重绘，而不是逐个卡面串行等待
             await page.evaluate('''
                 async () => {
-                    const images = Array.from(document.images);
-                    await Promise.all(images.map(img => {
-                        if (img.decode) return img.decode().catch(() => {});
-                        if (img.complete) return Promise.resolve();
-                        return new Promise(res => { img.onload = () => res(); img.onerror = () => res(); });
-                    }));
-                    if (document.fonts && document.fonts.ready) {
-                        await document.fonts.ready;
+                    const items = [];
+                    for (const side of document.querySelectorAll(".card .card-front, .card .card-back, .card .card-side")) {
+                        const content = side.querySelector(".card-content");
+                        if (!content) continue;
+                        items.push({
+                            content,
+                            available: side.clientHeight - 2, // 微调容错
+                            fontSize: parseFloat(getComputedStyle(content).fontSize),
+                        });
                     }
-                }
-            ''')
-        except Exception:
-            pass
-
-        # 注入JavaScript以动态调整字体大小（同时支持 single 与 a4_8 结构）
-        await page.evaluate('''
-            async () => {
-                const sides = document.querySelectorAll(".card .card-front, .card .card-back, .card .card-side");
-                for (const side of sides) {
-                    const content = side.querySelector(".card-content");
-                    if (!content) continue;
-                    let fontSize = parseFloat(getComputedStyle(content).fontSize);
-                    const available = side.clientHeight - 2; // 微调容错
-                    while (content.scrollHeight > available && fontSize > 8) {
-                        fontSize -= 0.5;
-                        content.style.fontSize = `${fontSize}px`;
+                    const overflowing = it => it.content.scrollHeight > it.available && it.fontSize > 8;
+                    let pending = items.filter(overflowing);
+                    while (pending.length) {
+                        for (const it of pending) {
+                            it.fontSize -= 0.5;
+                            it.content.style.fontSize = `${it.fontSize}px`;
+                        }
                         await new Promise(r => requestAnimationFrame(r));
+                        pending = pending.filter(overflowing);
                     }
                 }
-            }
-        ''')
-        
-        # 根据布局设置PDF选项
-        if layout == "single":
-            card_width_str = style_params.get('card_width', '85mm')
-            card_height_str = style_params.get('card_height', '55mm')
-
-            # 提取数值和单位
-            width_val = float(re.findall(r"[\d\.]+", card_width_str)[0])
-            height_val = float(re.findall(r"[\d\.]+", card_height_str)[0])
-
-            pdf_options = {
-                "width": card_width_str,
-                "height": card_height_str,
-                "margin": {"top": "0", "right": "0", "bottom": "0", "left": "0"},
-                "print_background": True,
-                "landscape": width_val > height_val
-            }
-        elif layout == "a4_8":
-            pdf_options = {
-                "format": "A4",
-                "landscape": True,
-                "margin": {"top": "10mm", "right": "10mm", "bottom": "10mm", "left": "10mm"},
-                "print_background": True,
-            }
-        else:
-            pdf_options = {
-                "format": "A4",
-                "print_background": True,
-                "margin": {"top": "0", "bottom": "0", "left": "0", "right": "0"}
-            }
-        
-        # 生成PDF
-        pdf_bytes = await page.pdf(**pdf_options)
+            ''')
         
-        await browser.close()
+            # 根据布局设置PDF选项
+            if layout == "single":
+                card_width_str = style_params.get('card_width', '85mm')
+                card_height_str = style_params.get('card_height', '55mm')
+
+                # 提取数值和单位
+                width_val = float(_NUMBER_RE.search(card_width_str).group())
+                height_val = float(_NUMBER_RE.search(card_height_str).group())
+
+                pdf_options = {
+                    "width": card_width_str,
+                    "height": card_height_str,
+                    "margin": {"top": "0", "right": "0", "bottom": "0", "left": "0"},
+                    "print_background": True,
+                    "landscape": width_val > height_val
+                }
+            elif layout == "a4_8":
+                pdf_options = {
+                    "format": "A4",
+                    "landscape": True,
+                    "margin": {"top": "10mm", "right": "10mm", "bottom": "10mm", "left": "10mm"},
+                    "print_background": True,
+                }
+            else:
+                pdf_options = {
+                    "format": "A4",
+                    "print_background": True,
+                    "margin": {"top": "0", "bottom": "0", "left": "0", "right": "0"}
+                }
         
-        if pdf_bytes is None:
-            raise RuntimeError("PDF生成失败")
+            # 生成PDF
+            pdf_bytes = await page.pdf(**pdf_options)
+        finally:
+            await context.close()
         
-        return pdf_bytes
+    if pdf_bytes is None:
+        raise RuntimeError("PDF生成失败")
+
+    if cache_key is not None:
+        _pdf_cache_put(cache_key, pdf_bytes)
+    
+    return pdf_bytes
 
 
 def generate_flashcards_pdf(
@@ -376,7 +615,14 @@ def generate_flashcards_pdf(
         bytes: 生成的 PDF 文件的字节数据。
                Byte data of the generated PDF file.
     """
-    return asyncio.run(generate_flashcards_pdf_async(flashcard_data, layout))
+    async def _generate_once() -> bytes:
+        # asyncio.run 每次创建新的事件循环，结束前关闭本次启动的浏览器
+        try:
+            return await generate_flashcards_pdf_async(flashcard_data, layout)
+        finally:
+            await close_pdf_browser()
+
+    return asyncio.run(_generate_once())
 
 
 def save_pdf_to_file(pdf_bytes: bytes, output_path: str, filename: str) -> str:
@@ -399,10 +645,6 @@ def save_pdf_to_file(pdf_bytes: bytes, output_path: str, filename: str) -> str:
     """
     # 统一输出目录：若未提供则使用配置默认值
     if not output_path:
-        try:
-            from config import OUTPUT_DIR as DEFAULT_OUTPUT_DIR
-        except Exception:
-            DEFAULT_OUTPUT_DIR = "test_output"
         output_path = DEFAULT_OUTPUT_DIR
     # 确保输出目录存在
     os.makedirs(output_path, exist_ok=True)
@@ -446,10 +688,6 @@ def generate_and_save_pdf(
     """
     # 统一输出目录：若未提供则使用配置默认值
     if not output_path:
-        try:
-            from config import OUTPUT_DIR as DEFAULT_OUTPUT_DIR
-        except Exception:
-            DEFAULT_OUTPUT_DIR = "test_output"
         output_path = DEFAULT_OUTPUT_DIR
     # 确保输出目录存在
     os.makedirs(output_path, exist_ok=True)
@@ -1,7 +1,6 @@
 from fastapi import FastAPI, Request, UploadFile, File, Form, APIRouter
-from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
+from fastapi.responses import JSONResponse, HTMLResponse, Response, StreamingResponse
 import os
-import io
 import json
 import uvicorn
 import traceback
@@ -12,15 +11,51 @@ import sys
 import re
 from typing import Optional, List, cast
 from starlette.types import ASGIApp
-from src.handlers.card_generator import generate_flashcards
-from src.handlers.pdf_generator import generate_flashcards_pdf_async
-from src.utils.csv_reader import convert_csv_to_json_data
+
+try:
+    import orjson  # 可选的 C 加速 JSON 解析器
+except ImportError:  # pragma: no cover - 回退到标准库
+    orjson = None
+# 生成器与 CSV 工具在各路由内按需导入，避免启动时加载 markdown/jinja2/playwright 依赖
 from src.utils.json_validator import FlashcardData  # 导入 FlashcardData 模型
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastmcp import FastMCP # 导入 FastMCP
+from fastmcp.server.openapi import RouteMap, MCPType
 from config import TEMPLATES_DIR, FLASHCARD_CONFIG, STATIC_DIR  # 导入模板目录配置、闪卡配置与静态目录
 
+# 预览用示例数据（tests/test_data.json 不存在时使用），模块级常量避免每次请求重建，只读共享
+_PREVIEW_SAMPLE_CARDS = (
+    {"front": "Question/问题", "back": "Answer/答案", "tags": ["Preview"]},
+)
+_PREVIEW_PDF_SAMPLE = {
+    "metadata": {"title": "Preview Flashcard Set", "description": "Sample data generated flashcard page"},
+    "style": {"template": "default", "theme": "light"},
+    "cards": ({"front": "Question", "back": "Answer", "tags": ["Example"]},),
+}
+
+# 解析过的 JSON 文件，按路径缓存并以 (mtime, size) 判断是否过期；返回值只读共享
+_JSON_FILE_CACHE = {}
+
+
+def _load_json_file(path: str):
+    """
+    读取并解析 JSON 文件（orjson 可用时使用其 C 解析器），文件未变化时直接复用上次的解析结果。
+
+    Loads and parses a JSON file (with orjson when available), reusing the previous result while the file is unchanged.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, 'rb') as f:
+        raw = f.read()
+    loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _JSON_FILE_CACHE[path] = (stamp, loaded)
+    return loaded
+
+
 # 使用 config.py 中的模板目录配置
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
@@ -46,6 +81,10 @@ from contextlib import asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("FlashCardMCP app started")
     yield
+    # 若 PDF 生成器已被加载，关闭其共享的浏览器会话
+    pdf_generator = sys.modules.get("src.handlers.pdf_generator")
+    if pdf_generator is not None:
+        await pdf_generator.close_pdf_browser()
     logger.info("FlashCardMCP app shutdown")
 
 
@@ -65,9 +104,13 @@ async def log_requests(request: Request, call_next):
     response = await call_next(request)
     return response
 
-# 创建 FastMCP 应用实例并挂载到 FastAPI 应用
-mcp_app = FastMCP.from_fastapi(app=app)
-app.mount("/mcp", cast(ASGIApp, mcp_app))
+# 仅将对外工具端点暴露为 MCP 工具（在文件末尾 include_router 之后应用）；正则预编译并锚定，非匹配路径在 /api/ 之后即失败
+# 非捕获分组 + ASCII 模式：路径均为 ASCII，无需 Unicode 字符类，也不保存分组结果
+_MCP_ROUTE_PATTERN = re.compile(r"^/api/(?:convert_to_flashcards|export_pdf|upload_csv)$", re.ASCII)
+_MCP_ROUTE_MAPS = [
+    RouteMap(pattern=_MCP_ROUTE_PATTERN, mcp_type=MCPType.TOOL),
+    RouteMap(mcp_type=MCPType.EXCLUDE),
+]
 
 # 挂载静态文件目录，提供 /static 资源访问
 try:
@@ -88,16 +131,18 @@ async def index(request: Request):
 async def preview(request: Request, dataset: str = "all", template: str = "minimal", theme_param: Optional[str] = None, show_deck_name: bool = False, show_card_index: bool = False):
     """
     Preview flashcard page.
-    Loads `tests/test_data.json`, merges datasets if needed, and renders HTML via `generate_flashcards` using the selected template.
+    Loads `tests/test_data.json`, merges datasets if needed, and streams the HTML rendered by `stream_flashcards` using the selected template.
 
     Args:
         dataset (str): Dataset name, currently only "all" is supported, meaning all datasets are merged.
         template (str): Template name to use for rendering (e.g., "minimal", "listen", "default"). Defaults to "minimal".
 
     Returns:
-        HTMLResponse: Response containing the generated flashcard HTML content.
+        StreamingResponse: Response streaming the generated flashcard HTML content.
     """
     try:
+        from src.handlers.card_generator import stream_flashcards
+
         logger.info(f"[preview] dataset={dataset}, template={template}, theme_param={theme_param}, show_deck_name={show_deck_name}, show_card_index={show_card_index}")
         # 修复 __file__ 未定义的问题，使用当前工作目录
         project_root = os.path.abspath(os.path.join(os.getcwd()))
@@ -115,9 +160,7 @@ async def preview(request: Request, dataset: str = "all", template: str = "minim
             return {
                 "metadata": {"title": "Preview_dataset", "description": "preview dataset page show"},
                 "style": {"template": template, "theme": theme_param or "light"},
-                "cards": [
-                    {"front": "Question/问题", "back": "Answer/答案", "tags": ["Preview"]}
-                ]
+                "cards": _PREVIEW_SAMPLE_CARDS
             }
 
         def _build_preview_json(template_name):
@@ -133,8 +176,7 @@ async def preview(request: Request, dataset: str = "all", template: str = "minim
                 dict: Formatted flashcard JSON data.
             """
             if os.path.exists(sample_path):
-                with open(sample_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                loaded = _load_json_file(sample_path)
                 # 合并所有数据集的 cards
                 merged_cards = []
                 title_for_deck = "Preview Flashcard Set"
@@ -161,7 +203,8 @@ async def preview(request: Request, dataset: str = "all", template: str = "minim
                                     if isinstance(c, dict):
                                         tags = c.get('tags', [])
                                         if key not in tags:
-                                            c['tags'] = tags + [key]
+                                            # 复制后再加标签，不修改缓存中的共享数据
+                                            c = dict(c, tags=tags + [key])
                                         merged_cards.append(c)
                 # 合并样式：优先使用 test_data.json 中的 style，再覆盖模板与主题
                 merged_style = {}
@@ -213,9 +256,9 @@ async def preview(request: Request, dataset: str = "all", template: str = "minim
         logger.info(f"sample_json={json.dumps(sample_json, ensure_ascii=False, indent=2)}")
         logger.info(f"[preview] style={sample_json.get('style')}, cards={len(sample_json.get('cards', []))}")
 
-        # 使用生成器根据 JSON 渲染为完整 HTML
-        html_content = generate_flashcards(sample_json)
-        return HTMLResponse(content=html_content)
+        # 使用生成器根据 JSON 流式渲染 HTML，首个块无需等待整页渲染完成
+        html_chunks = stream_flashcards(sample_json)
+        return StreamingResponse(html_chunks, media_type="text/html; charset=utf-8")
     except Exception as e:
         logger.exception("Preview generation failed")
         return HTMLResponse(status_code=500, content=f"<p>Preview generation failed: {e}</p>")
@@ -229,10 +272,12 @@ async def preview_pdf(layout: str = 'a4_8', show_deck_name: bool = False, show_c
         layout (str): Controls the printing layout of the PDF. Possible values are 'single' or 'a4_8' (default).
 
     Returns:
-        StreamingResponse: Response containing the generated PDF file, available for download.
+        Response: Response containing the generated PDF file, available for download.
         HTMLResponse: Returns an error message if PDF generation fails.
     """
     try:
+        from src.handlers.pdf_generator import generate_flashcards_pdf_async
+
         # 修复 __file__ 未定义的问题，使用当前工作目录
         project_root = os.path.abspath(os.path.join(os.getcwd()))
         sample_path = os.path.join(project_root, 'tests', 'test_data.json')
@@ -245,11 +290,7 @@ async def preview_pdf(layout: str = 'a4_8', show_deck_name: bool = False, show_c
             Returns:
                 dict: Dictionary containing default flashcard data.
             """
-            return {
-                "metadata": {"title": "Preview Flashcard Set", "description": "Sample data generated flashcard page"},
-                "style": {"template": "default", "theme": "light"},
-                "cards": [{"front": "Question", "back": "Answer", "tags": ["Example"]}]
-            }
+            return _PREVIEW_PDF_SAMPLE
 
         def _build_preview_json():
             """
@@ -261,8 +302,7 @@ async def preview_pdf(layout: str = 'a4_8', show_deck_name: bool = False, show_c
                 dict: Formatted flashcard JSON data.
             """
             if os.path.exists(sample_path):
-                with open(sample_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
+                loaded = _load_json_file(sample_path)
                 merged_cards = []
                 title_for_deck = "Preview Flashcard Set"
                 description_for_deck = "tests/test_data.json Merged View"
@@ -283,7 +323,8 @@ async def preview_pdf(layout: str = 'a4_8', show_deck_name: bool = False, show_c
                                     if isinstance(c, dict):
                                         tags = c.get('tags', [])
                                         if key not in tags:
-                                            c['tags'] = tags + [key]
+                                            # 复制后再加标签，不修改缓存中的共享数据
+                                            c = dict(c, tags=tags + [key])
                                         merged_cards.append(c)
                 # 合并样式：优先使用 test_data.json 中的 style
                 merged_style = {}
@@ -316,8 +357,8 @@ async def preview_pdf(layout: str = 'a4_8', show_deck_name: bool = False, show_c
         unique_id = uuid.uuid4().hex[:8]  # 生成一个8位的随机字符串
         filename = f"{sample_json.get('metadata', {}).get('title', 'preview')}_{unique_id}.pdf"
         encoded_filename = urllib.parse.quote(filename)
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        return Response(
+            content=pdf_bytes,
             media_type='application/pdf',
             headers={'Content-Disposition': f"attachment; filename*=UTF-8''{encoded_filename}"}
         )
@@ -336,6 +377,8 @@ async def convert_to_flashcards(flashcard_data: FlashcardData):
         flashcard_data (FlashcardData): Pydantic model containing flashcard data.
     """
     try:
+        from src.handlers.card_generator import generate_flashcards
+
         # 将 Pydantic 模型转换为字典，并包含所有字段
         json_data = flashcard_data.model_dump(exclude_unset=False)
         
@@ -362,7 +405,7 @@ async def export_pdf(request: Request):
         request (Request): FastAPI Request object, containing flashcard JSON data.
 
     Returns:
-        StreamingResponse: Response containing the generated PDF file, available for download.
+        Response: Response containing the generated PDF file, available for download.
         JSONResponse: Returns an error message if PDF generation fails.
     """
     try:
@@ -371,13 +414,15 @@ async def export_pdf(request: Request):
         return JSONResponse({"error": "请求体必须是有效的 JSON"}, status_code=400)
 
     try:
+        from src.handlers.pdf_generator import generate_flashcards_pdf_async
+
         layout = payload.get('layout', 'a4_8')
         pdf_bytes = await generate_flashcards_pdf_async(payload, layout=layout)
         unique_id = uuid.uuid4().hex[:8]
         filename = f"{payload.get('metadata', {}).get('title', 'flashcards')}_{unique_id}.pdf"
         encoded_filename = urllib.parse.quote(filename)
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        return Response(
+            content=pdf_bytes,
             media_type='application/pdf',
             headers={'Content-Disposition': f"attachment; filename*=UTF-8''{encoded_filename}"}
         )
@@ -410,7 +455,7 @@ async def upload_csv(
     - output_format: Output format (json/html/pdf, default html).
 
     Returns:
-        JSONResponse | StreamingResponse: Returns flashcard data in JSON format, HTML content, or a PDF file stream based on `output_format`.
+        JSONResponse | Response: Returns flashcard data in JSON format, HTML content, or a PDF file based on `output_format`.
     """
     try:
         # 验证输出格式
@@ -440,58 +485,55 @@ async def upload_csv(
                 'message': '列索引必须是有效的数字，用逗号分隔'
             })
         
-        # 读取文件内容并保存到临时文件
+        # 读取文件内容，直接在内存中解析（不再落盘到临时文件）
         content = await file.read()
         csv_content = content.decode('utf-8')
         
-        # 创建临时文件
-        temp_file_path = f"/tmp/{file.filename}"
-        with open(temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-        
         # 使用文件名作为默认标题
         if not title:
             title = file.filename.replace('.csv', '')
         
-        try:
-            # 转换CSV为JSON格式
-            json_data = convert_csv_to_json_data(
-                file_path=temp_file_path,
-                title=title,
-                front_columns=front_column_list,
-                back_columns=back_column_list,
-                tags_column_index=tags_column,
-                has_header=has_header,
-                column_separator=column_separator
-            )
-            
-            # 根据输出格式返回不同的结果
-            if output_format == "json":
-                return JSONResponse(content={
-                    'success': True,
-                    'result': json_data
-                })
-            elif output_format == "html":
-                html_content = generate_flashcards(json_data)
-                return JSONResponse(content={
-                    'success': True,
-                    'result': {'html': html_content}
-                })
-            elif output_format == "pdf":
-                pdf_bytes = await generate_flashcards_pdf_async(json_data, layout='a4_8')
-                unique_id = uuid.uuid4().hex[:8]
-                filename = f"{title}_{unique_id}.pdf"
-                encoded_filename = urllib.parse.quote(filename)
-                return StreamingResponse(
-                    io.BytesIO(pdf_bytes),
-                    media_type='application/pdf',
-                    headers={'Content-Disposition': f"attachment; filename*=UTF-8''{encoded_filename}"}
-                )
-        finally:
-            # 清理临时文件
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+        from src.utils.csv_reader import convert_csv_to_json_data_from_text
+
+        # 转换CSV为JSON格式
+        json_data = convert_csv_to_json_data_from_text(
+            csv_content,
+            title=title,
+            front_columns=front_column_list,
+            back_columns=back_column_list,
+            tags_column_index=tags_column,
+            has_header=has_header,
+            column_separator=column_separator,
+            source_name=file.filename
+        )
         
+        # 根据输出格式返回不同的结果
+        if output_format == "json":
+            return JSONResponse(content={
+                'success': True,
+                'result': json_data
+            })
+        elif output_format == "html":
+            from src.handlers.card_generator import generate_flashcards
+
+            html_content = generate_flashcards(json_data)
+            return JSONResponse(content={
+                'success': True,
+                'result': {'html': html_content}
+            })
+        elif output_format == "pdf":
+            from src.handlers.pdf_generator import generate_flashcards_pdf_async
+
+            pdf_bytes = await generate_flashcards_pdf_async(json_data, layout='a4_8')
+            unique_id = uuid.uuid4().hex[:8]
+            filename = f"{title}_{unique_id}.pdf"
+            encoded_filename = urllib.parse.quote(filename)
+            return Response(
+                content=pdf_bytes,
+                media_type='application/pdf',
+                headers={'Content-Disposition': f"attachment; filename*=UTF-8''{encoded_filename}"}
+            )
+
         return JSONResponse(status_code=500, content={
             'success': False,
             'error': 'UNKNOWN_ERROR',
@@ -507,6 +549,11 @@ async def upload_csv(
 
 app.include_router(api_router)
 
+# 创建 FastMCP 应用实例并挂载到 FastAPI 应用
+# from_fastapi 在调用时读取 OpenAPI 规范，因此必须在全部路由声明并包含 api_router 之后执行，路由映射才能匹配到端点
+mcp_app = FastMCP.from_fastapi(app=app, route_maps=_MCP_ROUTE_MAPS)
+app.mount("/mcp", cast(ASGIApp, mcp_app))
+
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
@@ -1,11 +1,12 @@
 # utils 模块初始化文件
 
 # 从子模块导入所有公开的函数和类
-from .json_validator import validate_json_structure
+from .json_validator import validate_json_structure, validate_and_normalize
 from .markdown_parser import parse_markdown
 
 # 定义模块的公开接口
 __all__ = [
     "validate_json_structure",
+    "validate_and_normalize",
     "parse_markdown"
 ]
\ No newline at end of file
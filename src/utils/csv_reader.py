@@ -1,28 +1,200 @@
 import csv
+import io
 import os
-from typing import Dict, Any, Optional, List
+from operator import itemgetter
+from typing import Callable, Dict, Any, Iterable, Optional, List, Sequence, TextIO
 from src.utils.json_validator import normalize_json_data
 
+def _column_joiner(columns: Sequence[int], separator: str) -> Callable[[Sequence[str]], str]:
+    """
+    Builds a function that joins the stripped, non-empty cells at the given column indices.
+    The common single-column case skips the tuple/filter/join machinery entirely.
+    """
+    if not columns:
+        return lambda row: ""
+    if len(columns) == 1:
+        index = columns[0]
+        return lambda row: row[index].strip()
+    getter = itemgetter(*columns)
+    return lambda row: separator.join(filter(None, map(str.strip, getter(row))))
+
+
+def _build_flashcard_data(
+    lines: Iterable[str],
+    title: str,
+    front_columns: Optional[List[int]],
+    back_columns: Optional[List[int]],
+    tags_column_index: Optional[int],
+    has_header: bool,
+    column_separator: str,
+    source_name: str,
+    normalize: bool = True
+) -> Dict[str, Any]:
+    """
+    Parses CSV lines into a normalized flashcard JSON data structure.
+
+    Args:
+        lines (Iterable[str]): CSV lines, e.g. an open file or an `io.StringIO`.
+        title (str): Title of the flashcard set.
+        front_columns (Optional[List[int]]): Column indices used as the card front (defaults to [0]).
+        back_columns (Optional[List[int]]): Column indices used as the card back (defaults to [1]).
+        tags_column_index (Optional[int]): Column index for comma-separated tags.
+        has_header (bool): Whether the first row is a header row.
+        column_separator (str): Separator used when concatenating content from multiple columns.
+        source_name (str): Name of the CSV source, used in the generated description.
+        normalize (bool): Whether to validate and normalize the result. Pass False when the caller validates its own final structure.
+
+    Returns:
+        Dict[str, Any]: Normalized flashcard JSON data (the raw `{"metadata", "cards"}` structure when `normalize` is False).
+
+    Raises:
+        ValueError: If no valid data rows are found to create cards.
+    """
+    # 设置默认列索引
+    if front_columns is None:
+        front_columns = [0]
+    if back_columns is None:
+        back_columns = [1]
+
+    # 计算所需的最大列索引
+    all_columns = [*front_columns, *back_columns]
+    if tags_column_index is not None:
+        all_columns.append(tags_column_index)
+    max_index = max(all_columns) if all_columns else 0
+    join_front = _column_joiner(front_columns, column_separator)
+    join_back = _column_joiner(back_columns, column_separator)
+
+    cards = []
+    reader = csv.reader(lines)
+
+    if has_header:
+        try:
+            next(reader)  # Skip header row
+        except StopIteration:
+            pass # File is empty
+
+    for row in reader:
+        if not row: # Skip empty rows
+            continue
+
+        if len(row) <= max_index:
+            # If the number of columns in the row is not enough to get all the required indices, skip this row
+            continue
+
+        # 合并front/back列的内容（行长度已校验，每个单元格只 strip 一次）
+        front_content = join_front(row)
+        back_content = join_back(row)
+
+        if not front_content:
+            continue
+
+        card: Dict[str, Any] = {
+            "front": front_content,
+            "back": back_content,
+        }
+
+        if tags_column_index is not None and len(row) > tags_column_index:
+            tags_str = row[tags_column_index].strip()
+            if tags_str:
+                tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
+                if tags:
+                    card["tags"] = tags
+        
+        cards.append(card)
+
+    if not cards:
+        raise ValueError("No valid data rows found in the CSV file to create cards.")
+
+    # 构建初步的JSON结构
+    flashcard_data = {
+        "metadata": {
+            "title": title,
+            "description": f"Flashcard set generated from {source_name} with {len(cards)} cards.",
+        },
+        "cards": cards
+    }
+
+    if not normalize:
+        return flashcard_data
+
+    # 使用json_validator进行验证和规范化
+    normalized_data = normalize_json_data(flashcard_data)
+    
+    return normalized_data
+
+
+def convert_csv_to_json_data_from_text(
+    csv_text: str,
+    title: Optional[str] = None,
+    front_columns: Optional[List[int]] = None,
+    back_columns: Optional[List[int]] = None,
+    tags_column_index: Optional[int] = None,
+    has_header: bool = True,
+    column_separator: str = " ",
+    source_name: str = "CSV data",
+    normalize: bool = True
+) -> Dict[str, Any]:
+    """
+    Converts CSV content held in memory into a flashcard JSON data structure using column indices,
+    without writing it to a temporary file.
+
+    Args:
+        csv_text (str): Raw CSV content.
+        title (Optional[str]): (Optional) Title of the flashcard set. Defaults to `source_name` without its extension.
+        front_columns (Optional[List[int]]): (Optional) List of column indices to be used as the front of the cards (defaults to [0]).
+        back_columns (Optional[List[int]]): (Optional) List of column indices to be used as the back of the cards (defaults to [1]).
+        tags_column_index (Optional[int]): (Optional) Column index for tags, where multiple tags are separated by commas.
+        has_header (bool): (Optional) Whether the CSV content contains a header row (defaults to True).
+        column_separator (str): (Optional) Separator used when concatenating content from multiple columns (defaults to a space).
+        source_name (str): (Optional) Name of the CSV source (e.g. the uploaded filename), used in the generated description.
+        normalize (bool): (Optional) Whether to validate and normalize the result (defaults to True). Pass False to skip this pass when the caller validates the final structure itself.
+
+    Returns:
+        Dict[str, Any]: JSON data conforming to the flashcard system format and validated.
+
+    Raises:
+        Exception: If errors occur while processing the CSV content.
+        ValueError: If no valid data rows are found in the CSV content to create cards.
+    """
+    if title is None:
+        title = os.path.splitext(source_name)[0]
+
+    try:
+        return _build_flashcard_data(
+            io.StringIO(csv_text), title, front_columns, back_columns,
+            tags_column_index, has_header, column_separator, source_name,
+            normalize
+        )
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Error reading or processing CSV file: {str(e)}")
+
+
 def convert_csv_to_json_data(
-    file_path: str,
+    file_path: Optional[str] = None,
     title: Optional[str] = None,
     front_columns: Optional[List[int]] = None,
     back_columns: Optional[List[int]] = None,
     tags_column_index: Optional[int] = None,
     has_header: bool = True,
-    column_separator: str = " "
+    column_separator: str = " ",
+    file_obj: Optional[TextIO] = None
 ) -> Dict[str, Any]:
     """
     Converts a CSV file into a flashcard JSON data structure using column indices.
+    Either `file_path` or an already open text stream `file_obj` (e.g. `io.StringIO`) must be given;
+    a stream is read in place and is not closed.
 
     Args:
-        file_path (str): Path to the CSV file.
+        file_path (Optional[str]): Path to the CSV file.
         title (Optional[str]): (Optional) Title of the flashcard set. Defaults to the filename if not provided.
         front_columns (Optional[List[int]]): (Optional) List of column indices to be used as the front of the cards (defaults to [0]).
         back_columns (Optional[List[int]]): (Optional) List of column indices to be used as the back of the cards (defaults to [1]).
         tags_column_index (Optional[int]): (Optional) Column index for tags, where multiple tags are separated by commas.
         has_header (bool): (Optional) Whether the CSV file contains a header row (defaults to True).
         column_separator (str): (Optional) Separator used when concatenating content from multiple columns (defaults to a space).
+        file_obj (Optional[TextIO]): (Optional) Open text stream to read the CSV from instead of `file_path`.
 
     Returns:
         Dict[str, Any]: JSON data conforming to the flashcard system format and validated.
@@ -30,91 +202,33 @@ def convert_csv_to_json_data(
     Raises:
         FileNotFoundError: If the CSV file is not found.
         Exception: If other errors occur during reading or processing the CSV file.
-        ValueError: If no valid data rows are found in the CSV file to create cards.
+        ValueError: If no valid data rows are found in the CSV file to create cards, or neither `file_path` nor `file_obj` is given.
     """
+    if file_obj is None and file_path is None:
+        raise ValueError("Either file_path or file_obj must be provided.")
+
+    if file_obj is not None:
+        name = getattr(file_obj, 'name', None)
+        source_name = os.path.basename(name) if isinstance(name, str) else "CSV data"
+    else:
+        source_name = os.path.basename(file_path)
     if title is None:
-        title = os.path.splitext(os.path.basename(file_path))[0]
+        title = os.path.splitext(source_name)[0]
 
-    # 设置默认列索引
-    if front_columns is None:
-        front_columns = [0]
-    if back_columns is None:
-        back_columns = [1]
-
-    cards = []
     try:
+        if file_obj is not None:
+            return _build_flashcard_data(
+                file_obj, title, front_columns, back_columns,
+                tags_column_index, has_header, column_separator, source_name
+            )
         with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            
-            if has_header:
-                try:
-                    next(reader)  # Skip header row
-                except StopIteration:
-                    pass # File is empty
-
-            for row in reader:
-                if not row: # Skip empty rows
-                    continue
-
-                # 计算所需的最大列索引
-                all_columns = front_columns + back_columns
-                if tags_column_index is not None:
-                    all_columns.append(tags_column_index)
-                max_index = max(all_columns) if all_columns else 0
-                
-                if len(row) <= max_index:
-                    # If the number of columns in the row is not enough to get all the required indices, skip this row
-                    continue
-
-                # 合并front列的内容
-                front_parts = []
-                for col_idx in front_columns:
-                    if col_idx < len(row) and row[col_idx].strip():
-                        front_parts.append(row[col_idx].strip())
-                front_content = column_separator.join(front_parts)
-
-                # 合并back列的内容
-                back_parts = []
-                for col_idx in back_columns:
-                    if col_idx < len(row) and row[col_idx].strip():
-                        back_parts.append(row[col_idx].strip())
-                back_content = column_separator.join(back_parts)
-
-                if not front_content:
-                    continue
-
-                card: Dict[str, Any] = {
-                    "front": front_content,
-                    "back": back_content,
-                }
-
-                if tags_column_index is not None and len(row) > tags_column_index:
-                    tags_str = row[tags_column_index].strip()
-                    if tags_str:
-                        tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-                        if tags:
-                            card["tags"] = tags
-                
-                cards.append(card)
-
+            return _build_flashcard_data(
+                file, title, front_columns, back_columns,
+                tags_column_index, has_header, column_separator, source_name
+            )
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file not found: {file_path}")
+    except ValueError:
+        raise
     except Exception as e:
         raise Exception(f"Error reading or processing CSV file: {str(e)}")
-
-    if not cards:
-        raise ValueError("No valid data rows found in the CSV file to create cards.")
-
-    # 构建初步的JSON结构
-    flashcard_data = {
-        "metadata": {
-            "title": title,
-            "description": f"Flashcard set generated from {os.path.basename(file_path)} with {len(cards)} cards.",
-        },
-        "cards": cards
-    }
-
-    # 使用json_validator进行验证和规范化
-    normalized_data = normalize_json_data(flashcard_data)
-    
-    return normalized_data
\ No newline at end of file
@@ -1,10 +1,25 @@
+import copy
+import hashlib
 import json
+import os
 import re
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Hashable, Optional, Tuple, Union
 from datetime import datetime
 from pydantic import BaseModel, Field, field_validator
 from config import FLASHCARD_CONFIG
 
+try:
+    import orjson  # optional C-accelerated encoder for the digest cache key
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+# 字段校验用的正则与取值集合在导入时编译一次，避免每次校验重复解析
+_DIMENSION_RE = re.compile(r'^\d+(\.\d+)?(px|%|em|rem|vw|vh|mm|cm|in|pt)$')
+_CSS_LENGTH_RE = re.compile(r'^\d+(\.\d+)?(px|%|em|rem)(\s+\d+(\.\d+)?(px|%|em|rem))*$')
+_VALID_TEXT_ALIGNS = ['left', 'center', 'right', 'justify', 'start', 'end']
+
 
 class Card(BaseModel):
     id: Optional[str] = None
@@ -119,7 +134,7 @@ class Style(BaseModel):
         if not isinstance(v, str):
             raise ValueError('尺寸值必须是字符串')
         v = v.strip()
-        if not re.match(r'^\d+(\.\d+)?(px|%|em|rem|vw|vh|mm|cm|in|pt)$', v):
+        if not _DIMENSION_RE.match(v):
             raise ValueError('尺寸值格式无效，应为数字+单位（如300px, 50%, 2em, 74.25mm）')
         return v
     
@@ -133,7 +148,7 @@ class Style(BaseModel):
     @field_validator('card_border_radius', 'card_padding')
     def validate_css_length(cls, v):
         """Validate CSS length values"""
-        if not re.match(r'^\d+(\.\d+)?(px|%|em|rem)(\s+\d+(\.\d+)?(px|%|em|rem))*$', v.strip()):
+        if not _CSS_LENGTH_RE.match(v.strip()):
             raise ValueError('CSS长度值格式无效')
         return v.strip()
     
@@ -142,9 +157,8 @@ class Style(BaseModel):
         """
         Validate text alignment values.
         """
-        valid_aligns = ['left', 'center', 'right', 'justify', 'start', 'end']
-        if v not in valid_aligns:
-            raise ValueError(f"无效的文本对齐值: {v}，有效值为: {valid_aligns}")
+        if v not in _VALID_TEXT_ALIGNS:
+            raise ValueError(f"无效的文本对齐值: {v}，有效值为: {_VALID_TEXT_ALIGNS}")
         return v
 
 
@@ -172,37 +186,111 @@ class FlashcardData(BaseModel):
         return v
 
 
-def validate_json_structure(json_data: Dict[str, Any]) -> Dict[str, Any]:
+# Pydantic 在类创建时已将模型编译为 pydantic-core 校验器；导入时绑定其方法，省去 model_validate 的分派开销
+_validate_python = FlashcardData.__pydantic_validator__.validate_python
+_validate_json = FlashcardData.__pydantic_validator__.validate_json
+
+
+# 设置 FLASHCARD_STRICT_KEY=1 时缓存键改用 JSON 序列化摘要（调试用）
+_STRICT_KEY = os.environ.get('FLASHCARD_STRICT_KEY') == '1'
+
+# 验证结果缓存：payload 缓存键 -> (规范化数据, 错误信息)
+# validate_json_structure 与 normalize_json_data 共用，先验证再生成时第二次调用直接命中
+_VALIDATION_CACHE_MAXSIZE = 128
+_VALIDATION_CACHE: "OrderedDict[Hashable, Tuple[Optional[Dict[str, Any]], Optional[str]]]" = OrderedDict()
+# 缓存会被多个线程（线程池路由、asyncio.to_thread）同时访问，读取/写入/淘汰需加锁；验证本身在锁外执行
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+
+def _freeze_leaf(value: Any) -> Any:
     """
-    Validates if the input JSON data structure conforms to the `FlashcardData` Pydantic model definition.
+    Returns a hashable key for a leaf value; non-string values are tagged with their type,
+    since `1`, `True` and `1.0` hash and compare equal but validate and render differently.
+    """
+    if value is None or type(value) is str:
+        return value
+    return (type(value), value)
 
-    Args:
-        json_data (Dict[str, Any]): The JSON data dictionary to be validated.
 
-    Returns:
-        Dict[str, Any]: A dictionary containing the validation result. If validation is successful, returns `{"is_valid": True, "error": None}`;
-                        if validation fails, returns `{"is_valid": False, "error": "error message"}`.
+def _freeze_mapping(mapping: Dict[str, Any]) -> tuple:
     """
-    try:
-        # 使用 Pydantic 模型进行验证
-        validated_data = FlashcardData(**json_data)
-        return {"is_valid": True, "error": None}
-    except Exception as e:
-        return {"is_valid": False, "error": str(e)}
+    Converts a flat mapping (one level of nested dicts allowed, e.g. `colors`) into a sorted tuple of items.
+    """
+    return tuple(sorted(
+        (key, tuple(sorted((k, _freeze_leaf(v)) for k, v in value.items())) if isinstance(value, dict) else _freeze_leaf(value))
+        for key, value in mapping.items()
+    ))
 
 
-def normalize_json_data(json_data: Dict[str, Any]) -> Dict[str, Any]:
+def _freeze_card(card: Dict[str, Any]) -> tuple:
     """
-    Normalizes the input JSON data, populating missing default values and generating unique IDs for cards without them.
+    Converts a card into a `(id, front, back, tags)` tuple.
+    """
+    tags = card.get('tags', ())
+    if not isinstance(tags, (list, tuple)):
+        raise TypeError('tags must be a list')
+    return (
+        _freeze_leaf(card.get('id')),
+        _freeze_leaf(card['front']),
+        _freeze_leaf(card.get('back', '')),
+        tuple(map(_freeze_leaf, tags)),
+    )
+
+
+def _json_key(json_data: Dict[str, Any]) -> bytes:
+    """
+    Computes a digest of the canonical JSON form of the payload.
+    """
+    if orjson is not None:
+        try:
+            # orjson 直接输出 UTF-8 字节，省去 str 编码步骤；超出其范围的输入（如超大整数）回退到标准库
+            canonical = orjson.dumps(json_data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            return hashlib.blake2b(canonical, digest_size=16).digest()
+        except TypeError:
+            pass
+    canonical = json.dumps(json_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+def flashcard_cache_key(json_data: Dict[str, Any]) -> Hashable:
+    """
+    Builds a hashable cache key for a flashcard payload, shared by the validation and PDF caches.
+    The typical `metadata`/`style`/`cards` shape is keyed structurally as nested tuples, avoiding the JSON encoder;
+    unusual shapes (or `FLASHCARD_STRICT_KEY=1`) fall back to a digest of the canonical JSON.
 
     Args:
-        json_data (Dict[str, Any]): The raw JSON dictionary containing flashcard data.
+        json_data (Dict[str, Any]): The flashcard payload.
 
     Returns:
-        Dict[str, Any]: The normalized flashcard data dictionary with all missing default values populated and each card having an ID.
+        Hashable: The cache key.
+
+    Raises:
+        TypeError: If the payload cannot be serialized for the JSON fallback.
+        ValueError: If the payload cannot be serialized for the JSON fallback.
+    """
+    if not _STRICT_KEY:
+        try:
+            # 缺省与空字典等价，显式 None 与之不同（模型会保留 None）
+            metadata = json_data.get('metadata', {})
+            style = json_data.get('style', {})
+            key = (
+                None if metadata is None else _freeze_mapping(metadata),
+                None if style is None else _freeze_mapping(style),
+                tuple(_freeze_card(card) for card in json_data['cards']),
+            )
+            hash(key)
+            return key
+        except (TypeError, KeyError, AttributeError):
+            pass
+    return _json_key(json_data)
+
+
+def _normalize(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates the payload with the `FlashcardData` model and returns the normalized dictionary.
     """
-    # 使用 Pydantic 模型进行验证和规范化
-    flashcard_data = FlashcardData(**json_data)
+    # 使用 Pydantic 模型预编译的核心校验器进行验证和规范化
+    flashcard_data = _validate_python(json_data)
     
     # 填充 id 字段
     for i, card in enumerate(flashcard_data.cards):
@@ -217,4 +305,122 @@ def normalize_json_data(json_data: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(result['metadata']['created_at'], datetime):
             result['metadata']['created_at'] = result['metadata']['created_at'].isoformat()
             
-    return result
\ No newline at end of file
+    return result
+
+
+def _validate_cached(json_data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validates and normalizes the payload once per distinct content, caching the outcome in a bounded LRU.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: `(normalized_data, None)` on success, `(None, error)` on failure.
+    """
+    try:
+        key = flashcard_cache_key(json_data)
+    except (TypeError, ValueError):
+        # 无法序列化的输入不缓存，直接验证
+        key = None
+
+    if key is not None:
+        with _VALIDATION_CACHE_LOCK:
+            entry = _VALIDATION_CACHE.get(key)
+            if entry is not None:
+                _VALIDATION_CACHE.move_to_end(key)
+        if entry is not None:
+            return entry
+
+    try:
+        entry = (_normalize(json_data), None)
+    except Exception as e:
+        entry = (None, str(e))
+
+    normalized = entry[0]
+    normalized_key = None
+    if normalized is not None:
+        # 规范化是幂等的：规范化结果本身也是有效输入，且再次规范化得到相同结果。
+        # 预先登记其键，调用方回传已规范化的数据（如 convert_csv_to_json 的输出）时无需重新验证
+        try:
+            normalized_key = flashcard_cache_key(normalized)
+        except (TypeError, ValueError):
+            normalized_key = None
+    with _VALIDATION_CACHE_LOCK:
+        if key is not None:
+            _VALIDATION_CACHE[key] = entry
+        if normalized_key is not None and normalized_key != key:
+            _VALIDATION_CACHE[normalized_key] = entry
+        while len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+    return entry
+
+
+def validate_json_structure(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates if the input JSON data structure conforms to the `FlashcardData` Pydantic model definition.
+    Results are cached by payload content, so repeated validation of the same data is free.
+
+    Args:
+        json_data (Dict[str, Any]): The JSON data dictionary to be validated.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the validation result. If validation is successful, returns `{"is_valid": True, "error": None}`;
+                        if validation fails, returns `{"is_valid": False, "error": "error message"}`.
+    """
+    _, error = _validate_cached(json_data)
+    return {"is_valid": error is None, "error": error}
+
+
+def validate_json_text(json_text: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Validates raw JSON text against the `FlashcardData` model, parsing and validating in a single pydantic-core pass
+    without materializing an intermediate Python dict.
+
+    Args:
+        json_text (Union[str, bytes]): The JSON document to be validated.
+
+    Returns:
+        Dict[str, Any]: `{"is_valid": True, "error": None}` on success, `{"is_valid": False, "error": "error message"}` on failure.
+    """
+    try:
+        _validate_json(json_text)
+    except Exception as e:
+        return {"is_valid": False, "error": str(e)}
+    return {"is_valid": True, "error": None}
+
+
+def validate_and_normalize(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validates and normalizes the input JSON data in a single pass over the cards.
+    Use this instead of calling `validate_json_structure` followed by `normalize_json_data`.
+    The result is shared with the validation cache and must be treated as read-only.
+
+    Args:
+        json_data (Dict[str, Any]): The raw JSON dictionary containing flashcard data.
+
+    Returns:
+        Dict[str, Any]: The normalized flashcard data dictionary with all missing default values populated and each card having an ID.
+
+    Raises:
+        ValueError: If the data does not conform to the `FlashcardData` model.
+    """
+    normalized, error = _validate_cached(json_data)
+    if error is not None:
+        raise ValueError(error)
+    return normalized
+
+
+def normalize_json_data(json_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalizes the input JSON data, populating missing default values and generating unique IDs for cards without them.
+    Validation is served from the same cache as `validate_and_normalize`, but the caller receives its own copy and may modify it.
+
+    Args:
+        json_data (Dict[str, Any]): The raw JSON dictionary containing flashcard data.
+
+    Returns:
+        Dict[str, Any]: The normalized flashcard data dictionary with all missing default values populated and each card having an ID.
+
+    Raises:
+        ValueError: If the data does not conform to the `FlashcardData` model.
+    """
+    # 缓存中的结果由内部调用方共享，对外返回独立副本，避免调用方修改污染后续结果
+    return copy.deepcopy(validate_and_normalize(json_data))
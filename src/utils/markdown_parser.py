@@ -1,7 +1,40 @@
 import markdown
+import os
 import re
 from markdown.extensions import fenced_code, tables, codehilite, toc, admonition
-from typing import Optional
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+# 可选的原生（Rust/C）Markdown 后端：设置 FLASHCARD_MARKDOWN_BACKEND=native 启用，未安装时回退到 Python-Markdown。
+# 原生后端遵循 CommonMark/GFM（含表格、删除线），但不支持 codehilite 代码高亮与 admonition 提示框，因此默认不启用。
+_BACKEND_SETTING = os.environ.get('FLASHCARD_MARKDOWN_BACKEND', 'python').strip().lower()
+
+
+def _load_native_renderer() -> Optional[Tuple[str, Callable[[str], str]]]:
+    """
+    Detects an installed native Markdown renderer, in order of preference: markdown-it-pyrs (Rust), then cmarkgfm (C).
+
+    Returns:
+        Optional[Tuple[str, Callable[[str], str]]]: The backend name and its render function, or None if neither is installed.
+    """
+    try:
+        from markdown_it_pyrs import MarkdownIt
+        return 'markdown-it-pyrs', MarkdownIt('commonmark').enable('table').enable('strikethrough').render
+    except ImportError:
+        pass
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options
+        # 允许原始 HTML 通过（删除线等预处理会生成内联标签），与 Python-Markdown 的行为一致
+        def render(text: str) -> str:
+            return cmarkgfm.github_flavored_markdown_to_html(text, options=Options.CMARK_OPT_UNSAFE)
+        return 'cmarkgfm', render
+    except ImportError:
+        pass
+    return None
+
+
+_NATIVE_RENDERER = _load_native_renderer() if _BACKEND_SETTING == 'native' else None
 
 
 class MarkdownParser:
@@ -46,6 +79,12 @@ class MarkdownParser:
             extensions=self.extensions,
             extension_configs=self.extension_configs
         )
+
+        # 仅在使用默认扩展且已启用原生后端时改用原生渲染；自定义扩展始终由 Python-Markdown 处理
+        if _NATIVE_RENDERER is not None and extensions is None:
+            self.backend, self._native_render = _NATIVE_RENDERER
+        else:
+            self.backend, self._native_render = 'python-markdown', None
     
     def parse(self, markdown_text: str) -> str:
         """
@@ -67,12 +106,16 @@ class MarkdownParser:
             return ''
         
         try:
-            # 重置解析器状态
-            self.md.reset()
             # 支持删除线 ~~text~~ -> <del>text</del>
             markdown_text = re.sub(r'(?<!`)~~([^~\n]+)~~(?<!`)', r'<del>\1</del>', markdown_text)
             # 转换 Markdown 到 HTML
-            html = self.md.convert(markdown_text)
+            if self._native_render is not None:
+                # 原生后端输出以换行结尾，去掉以与 Python-Markdown 的输出保持一致
+                html = self._native_render(markdown_text).rstrip('\n')
+            else:
+                # 重置解析器状态
+                self.md.reset()
+                html = self.md.convert(markdown_text)
 
             # 解除 <code> 包裹的数学表达式，确保 MathJax 能够渲染
             # 支持 $...$、$$...$$、\(...\)、\[...\]
@@ -129,6 +172,22 @@ class MarkdownParser:
             # 处理转换错误
             raise ValueError(f"Markdown 转换失败: {str(e)}")
     
+    def parse_many(self, markdown_texts: Iterable[str]) -> List[str]:
+        """
+        Converts a batch of Markdown texts into HTML, in order.
+        Equivalent to calling `parse` on each text, without the per-item method lookup.
+
+        Args:
+            markdown_texts (Iterable[str]): The Markdown texts to be converted.
+
+        Returns:
+            List[str]: The converted HTML strings, one per input text.
+
+        Raises:
+            ValueError: Raised if an error occurs during Markdown conversion.
+        """
+        return list(map(self.parse, markdown_texts))
+
     def parse_with_metadata(self, markdown_text: str) -> dict:
         """
         Converts Markdown text to HTML and extracts relevant metadata (e.g., Table of Contents).
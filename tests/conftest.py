@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 将项目根目录加入模块搜索路径，使测试可以直接导入 config 与 src 包
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
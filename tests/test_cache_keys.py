@@ -0,0 +1,62 @@
+"""
+flashcard_cache_key 的测试：类型标记的叶子值、JSON 摘要回退与 FLASHCARD_STRICT_KEY。
+
+Tests for flashcard_cache_key: type-tagged leaves, the JSON digest fallback and FLASHCARD_STRICT_KEY.
+"""
+from src.utils import json_validator
+from src.utils.json_validator import flashcard_cache_key
+
+
+def _payload(card_id=None, tags=None, metadata=None):
+    card = {'front': 'Q', 'back': 'A'}
+    if card_id is not None:
+        card['id'] = card_id
+    if tags is not None:
+        card['tags'] = tags
+    return {'metadata': metadata or {'title': 'Deck'}, 'style': {}, 'cards': [card]}
+
+
+def test_structural_key_is_hashable_tuple():
+    key = flashcard_cache_key(_payload())
+    assert isinstance(key, tuple)
+    assert hash(key) == hash(flashcard_cache_key(_payload()))
+
+
+def test_equal_payloads_share_key_regardless_of_dict_order():
+    a = {'metadata': {'title': 'Deck', 'author': 'X'}, 'style': {}, 'cards': [{'front': 'Q', 'back': 'A'}]}
+    b = {'cards': [{'back': 'A', 'front': 'Q'}], 'style': {}, 'metadata': {'author': 'X', 'title': 'Deck'}}
+    assert flashcard_cache_key(a) == flashcard_cache_key(b)
+
+
+def test_int_str_and_bool_leaves_do_not_collide():
+    # 1 == True == 1.0 且哈希相同，但验证与渲染结果不同，键必须区分
+    values = [1, '1', True, 1.0]
+    id_keys = {flashcard_cache_key(_payload(card_id=v)) for v in values}
+    tag_keys = {flashcard_cache_key(_payload(tags=[v])) for v in values}
+    meta_keys = {flashcard_cache_key(_payload(metadata={'title': 'Deck', 'version': v})) for v in values}
+    assert len(id_keys) == len(values)
+    assert len(tag_keys) == len(values)
+    assert len(meta_keys) == len(values)
+
+
+def test_unusual_shape_falls_back_to_json_digest():
+    # 列表值的元数据字段无法按结构转换为元组，回退到规范 JSON 的 blake2b 摘要
+    payload = _payload(metadata={'title': 'Deck', 'authors': ['a', 'b']})
+    key = flashcard_cache_key(payload)
+    assert isinstance(key, bytes)
+    assert len(key) == 16
+    assert key == flashcard_cache_key(_payload(metadata={'authors': ['a', 'b'], 'title': 'Deck'}))
+    assert key != flashcard_cache_key(_payload(metadata={'title': 'Deck', 'authors': ['b', 'a']}))
+
+
+def test_missing_cards_falls_back_to_json_digest():
+    assert isinstance(flashcard_cache_key({'metadata': {}}), bytes)
+
+
+def test_strict_key_uses_json_digest(monkeypatch):
+    payload = _payload()
+    monkeypatch.setattr(json_validator, '_STRICT_KEY', True)
+    key = flashcard_cache_key(payload)
+    assert isinstance(key, bytes)
+    assert key == json_validator._json_key(payload)
+    assert key != flashcard_cache_key(_payload(card_id='other'))
@@ -0,0 +1,59 @@
+"""
+HTML 渲染缓存的测试：模板文件修改后缓存失效。
+
+Tests for the rendered-HTML cache: editing the template file invalidates cached output.
+"""
+import os
+
+import pytest
+
+from src.handlers import card_generator
+
+
+PAYLOAD = {
+    'metadata': {'title': 'Deck'},
+    'style': {'template': 'minimal'},
+    'cards': [{'front': 'Q', 'back': 'A'}],
+}
+
+
+@pytest.fixture
+def temp_template(tmp_path, monkeypatch):
+    """将 'minimal' 模板指向临时文件，并清空 HTML 缓存。"""
+    path = tmp_path / 'minimal.html'
+    path.write_text('v1 {{ title }}', encoding='utf-8')
+    monkeypatch.setattr(card_generator, 'resolve_template', lambda name: str(path))
+    monkeypatch.setattr(card_generator, '_HTML_CACHE_ENABLED', True)
+    card_generator._HTML_CACHE.clear()
+    yield path
+    card_generator._HTML_CACHE.clear()
+
+
+def _rewrite(path, content):
+    """重写模板并把修改时间推后，避免文件系统时间精度导致 mtime 不变。"""
+    stat = os.stat(path)
+    path.write_text(content, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repeated_render_hits_cache(temp_template):
+    first = card_generator.generate_flashcards(PAYLOAD)
+    assert first == 'v1 Deck'
+    assert len(card_generator._HTML_CACHE) == 1
+    assert card_generator.generate_flashcards(PAYLOAD) is first
+
+
+def test_template_edit_invalidates_cache(temp_template):
+    old_key = card_generator._html_cache_key(PAYLOAD)
+    assert card_generator.generate_flashcards(PAYLOAD) == 'v1 Deck'
+
+    _rewrite(temp_template, 'v2 {{ title }}')
+
+    assert card_generator._html_cache_key(PAYLOAD) != old_key
+    assert card_generator.generate_flashcards(PAYLOAD) == 'v2 Deck'
+
+
+def test_touching_template_changes_cache_key(temp_template):
+    old_key = card_generator._html_cache_key(PAYLOAD)
+    _rewrite(temp_template, temp_template.read_text(encoding='utf-8'))
+    assert card_generator._html_cache_key(PAYLOAD) != old_key